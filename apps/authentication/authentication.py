@@ -3,72 +3,151 @@ from rest_framework.exceptions import AuthenticationFailed
 from django.contrib.auth import get_user_model
 from rest_framework_simplejwt.tokens import AccessToken
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
-import jwt
+from cachetools import TTLCache
+import hashlib
 import logging
+import threading
+import time
 from django.conf import settings
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# 요청마다 settings 속성 조회를 피하기 위해 모듈 로드 시 한 번만 읽음
+DEBUG = settings.DEBUG
+
+# 검증된 토큰 캐시 (sha256(token) -> (user_id, 만료 시각)), TTL 0이면 비활성화
+JWT_CACHE_TTL = settings.JWT_CACHE_TTL
+_jwt_cache = TTLCache(maxsize=10000, ttl=JWT_CACHE_TTL or 1)
+_jwt_cache_lock = threading.Lock()
+
+
+def _get_cached_user_id(cache_key):
+    """캐시된 토큰 검증 결과에서 user_id 조회 (만료 시 None)"""
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(cache_key)
+    if cached is None:
+        return None
+    user_id, expires_at = cached
+    if expires_at <= time.time():
+        return None
+    return user_id
+
+
+def _cache_user_id(cache_key, user_id, exp):
+    """토큰 검증 결과 저장 (토큰 만료 시각을 넘기지 않도록 제한)"""
+    now = time.time()
+    expires_at = min(now + JWT_CACHE_TTL, exp)
+    if expires_at <= now:
+        return
+    with _jwt_cache_lock:
+        _jwt_cache[cache_key] = (user_id, expires_at)
+
+
+# 인증 경로에서 필요한 사용자 컬럼 (나머지 컬럼은 접근 시 지연 로드)
+AUTH_USER_FIELDS = ('id', 'email', 'username', 'is_active')
+# Model.from_db()는 값이 모델 필드 순서대로 들어온다고 가정하므로 캐시 값도 같은 순서로 저장
+_AUTH_USER_ATTNAMES = tuple(
+    f.attname for f in User._meta.concrete_fields if f.attname in AUTH_USER_FIELDS
+)
+
+# 인증된 사용자 캐시 (user_id -> 인증 컬럼 값 튜플), TTL 0이면 비활성화
+# 요청 간에 같은 User 인스턴스를 공유하지 않도록 값만 저장하고 요청마다 새 인스턴스를 만든다
+USER_CACHE_TTL = settings.JWT_USER_CACHE_TTL
+_user_cache = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL or 1)
+_user_cache_lock = threading.Lock()
+
+
+def _get_user(user_id):
+    """user_id로 사용자 조회 (캐시 사용 시에만 인증에 필요한 컬럼만 로드)"""
+    if not USER_CACHE_TTL:
+        return User.objects.get(id=user_id)
+
+    with _user_cache_lock:
+        values = _user_cache.get(user_id)
+
+    if values is None:
+        values = User.objects.filter(id=user_id).values_list(*_AUTH_USER_ATTNAMES).first()
+        if values is None:
+            raise User.DoesNotExist(f"User {user_id} does not exist")
+        with _user_cache_lock:
+            _user_cache[user_id] = values
+
+    # 나머지 컬럼은 deferred 상태로 두고 접근 시 지연 로드
+    return User.from_db(User.objects.db, _AUTH_USER_ATTNAMES, values)
+
+
+def invalidate_cached_user(user_id):
+    """사용자 변경/삭제 시 캐시에서 제거"""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
 class CustomJWTAuthentication(BaseAuthentication):
     def authenticate(self, request):
-        if settings.DEBUG:
+        if DEBUG:
             logger.debug("=== CustomJWTAuthentication Debug ===")
-            logger.debug(f"Request path: {request.path}")
-            logger.debug(f"Request method: {request.method}")
-        
+            logger.debug("Request path: %s", request.path)
+            logger.debug("Request method: %s", request.method)
+
         auth_header = request.headers.get('Authorization')
-        
-        if settings.DEBUG:
-            logger.debug(f"Authorization header present: {bool(auth_header)}")
-        
+
+        if DEBUG:
+            logger.debug("Authorization header present: %s", bool(auth_header))
+
         if not auth_header:
-            if settings.DEBUG:
+            if DEBUG:
                 logger.debug("No Authorization header found")
             return None
-        
+
         try:
-            # "Bearer " 제거
+            # "Bearer " 제거 (접두어 확인 후 슬라이싱)
             if not auth_header.startswith('Bearer '):
-                if settings.DEBUG:
+                if DEBUG:
                     logger.debug("Invalid Authorization header format")
                 return None
-                
-            token = auth_header.split(' ')[1]
-            
-            if settings.DEBUG:
-                logger.debug(f"Token extracted (first 20 chars): {token[:20]}...")
-            
-            # JWT 토큰 검증 (djangorestframework-simplejwt 방식)
-            try:
-                access_token = AccessToken(token)
-                user_id = access_token['user_id']
-                
-                if settings.DEBUG:
-                    logger.debug(f"User ID from token: {user_id}")
-                    
-            except Exception as e:
-                if settings.DEBUG:
-                    logger.debug(f"AccessToken validation failed: {str(e)}")
-                # 대안: 직접 JWT 디코드
-                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=['HS256'])
-                user_id = payload.get('user_id')
-                
-                if settings.DEBUG:
-                    logger.debug(f"User ID from direct decode: {user_id}")
-            
+
+            token = auth_header[7:]
+
+            if DEBUG:
+                logger.debug("Token extracted (first 20 chars): %s...", token[:20])
+
+            # 캐시된 검증 결과가 있으면 서명 검증 생략 (원본 토큰은 저장하지 않음)
+            cache_key = hashlib.sha256(token.encode()).digest() if JWT_CACHE_TTL else None
+            user_id = _get_cached_user_id(cache_key) if cache_key else None
+
+            if user_id is not None:
+                if DEBUG:
+                    logger.debug("User ID from token cache: %s", user_id)
+            else:
+                user_id = self._verify_token(token, cache_key)
+
             # 사용자 조회
-            user = User.objects.get(id=user_id)
-            
-            if settings.DEBUG:
-                logger.debug(f"User authenticated successfully: {user.email}")
+            user = _get_user(user_id)
+
+            if DEBUG:
+                logger.debug("User authenticated successfully: %s", user.email)
                 logger.debug("=== Authentication Success ===")
-                
+
             return (user, None)
-            
-        except (IndexError, InvalidToken, TokenError, User.DoesNotExist) as e:
-            logger.warning(f"Authentication failed: {str(e)}")
+
+        except (InvalidToken, TokenError, KeyError, User.DoesNotExist) as e:
+            logger.warning("Authentication failed: %s", e)
             raise AuthenticationFailed('Invalid token')
         except Exception as e:
-            logger.error(f"Unexpected authentication error: {str(e)}")
-            raise AuthenticationFailed(f'Authentication failed: {str(e)}') 
\ No newline at end of file
+            logger.error("Unexpected authentication error: %s", e)
+            raise AuthenticationFailed(f'Authentication failed: {str(e)}')
+
+    def _verify_token(self, token, cache_key):
+        """JWT 토큰 검증 후 user_id 반환 (캐시 키가 있으면 결과 저장)"""
+        # JWT 토큰 검증 (djangorestframework-simplejwt 방식) - 실패 시 예외 전파
+        access_token = AccessToken(token)
+        user_id = access_token['user_id']
+
+        if cache_key:
+            _cache_user_id(cache_key, user_id, access_token['exp'])
+
+        if DEBUG:
+            logger.debug("User ID from token: %s", user_id)
+
+        return user_id
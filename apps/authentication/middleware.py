@@ -1,31 +1,30 @@
 import logging
-import re
-from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
 class JWTAuthDebugMiddleware:
+    """DEBUG 모드 전용 - settings.py에서 DEBUG일 때만 MIDDLEWARE에 등록됨"""
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-        if settings.DEBUG:
-            logger.debug("=== JWTAuthDebugMiddleware ===")
-            logger.debug(f"Request path: {request.path}")
-            logger.debug(f"Request method: {request.method}")
-            
-            # 민감한 정보 마스킹
-            auth_header = request.headers.get('Authorization', '')
-            if auth_header:
-                masked_auth = re.sub(r'Bearer\s+(.{10})', r'Bearer \1***', auth_header)
-                logger.debug(f"Authorization header: {masked_auth}")
-        
+        logger.debug("=== JWTAuthDebugMiddleware ===")
+        logger.debug("Request path: %s", request.path)
+        logger.debug("Request method: %s", request.method)
+
+        # 민감한 정보 마스킹
+        auth_header = request.headers.get('Authorization', '')
+        if auth_header:
+            # "Bearer " + 토큰 앞 10자만 남기고 마스킹 (정규식 없이 슬라이싱)
+            masked_auth = auth_header[:17] + '***' if auth_header.startswith('Bearer ') else '***'
+            logger.debug("Authorization header: %s", masked_auth)
+
         response = self.get_response(request)
-        
-        if settings.DEBUG:
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"User authenticated: {getattr(request, 'user', 'AnonymousUser').is_authenticated}")
-            logger.debug(f"User ID: {getattr(getattr(request, 'user', None), 'id', 'None')}")
-            logger.debug("=== End JWTAuthDebugMiddleware ===")
-        
-        return response 
\ No newline at end of file
+
+        logger.debug("Response status: %s", response.status_code)
+        logger.debug("User authenticated: %s", getattr(request, 'user', 'AnonymousUser').is_authenticated)
+        logger.debug("User ID: %s", getattr(getattr(request, 'user', None), 'id', 'None'))
+        logger.debug("=== End JWTAuthDebugMiddleware ===")
+
+        return response
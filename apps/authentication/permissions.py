@@ -1,22 +1,26 @@
 import logging
 from django.conf import settings
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated as DRFIsAuthenticated
 
 logger = logging.getLogger(__name__)
 
-class DebugIsAuthenticated(IsAuthenticated):
+class DebugIsAuthenticated(DRFIsAuthenticated):
+    """DEBUG 모드 전용 - 권한 검사 과정을 로깅하는 IsAuthenticated"""
+
     def has_permission(self, request, view):
-        if settings.DEBUG:
-            logger.debug("=== DebugIsAuthenticated ===")
-            logger.debug(f"User authenticated: {request.user.is_authenticated}")
-            logger.debug(f"User ID: {getattr(request.user, 'id', 'No ID')}")
-            logger.debug(f"View: {view.__class__.__name__}")
-            logger.debug(f"Request path: {request.path}")
-        
+        logger.debug("=== DebugIsAuthenticated ===")
+        logger.debug("User authenticated: %s", request.user.is_authenticated)
+        logger.debug("User ID: %s", getattr(request.user, 'id', 'No ID'))
+        logger.debug("View: %s", view.__class__.__name__)
+        logger.debug("Request path: %s", request.path)
+
         result = super().has_permission(request, view)
-        
-        if settings.DEBUG:
-            logger.debug(f"Permission result: {result}")
-            logger.debug("=== End DebugIsAuthenticated ===")
-        
-        return result 
\ No newline at end of file
+
+        logger.debug("Permission result: %s", result)
+        logger.debug("=== End DebugIsAuthenticated ===")
+
+        return result
+
+
+# DEBUG 모드에서만 디버그 로깅 권한 클래스 사용, 운영 환경에서는 DRF 기본 클래스 그대로 사용
+IsAuthenticated = DebugIsAuthenticated if settings.DEBUG else DRFIsAuthenticated
@@ -1,3 +1,37 @@
-from django.test import TestCase
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.backends import TokenBackend
 
-# Create your tests here.
+
+class ES256TokenBackendTest(SimpleTestCase):
+    """settings.py의 비대칭 JWT 설정(ES256 + P-256 키)으로 서명/검증이 되는지 확인"""
+
+    def setUp(self):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        self.signing_key = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        self.verifying_key = private_key.public_key().public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+
+    def test_sign_and_verify(self):
+        backend = TokenBackend('ES256', signing_key=self.signing_key, verifying_key=self.verifying_key)
+        token = backend.encode({'user_id': 1, 'token_type': 'access'})
+
+        payload = backend.decode(token)
+
+        self.assertEqual(payload['user_id'], 1)
+
+    def test_verify_with_public_key_only(self):
+        # 다른 서비스는 공개키만으로 검증
+        signer = TokenBackend('ES256', signing_key=self.signing_key, verifying_key=self.verifying_key)
+        verifier = TokenBackend('ES256', verifying_key=self.verifying_key)
+
+        payload = verifier.decode(signer.encode({'user_id': 7}))
+
+        self.assertEqual(payload['user_id'], 7)
@@ -1,21 +1,97 @@
 import requests
 import logging
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from .serializers import GoogleLoginSerializer
 from drf_yasg.utils import swagger_auto_schema
-from datetime import datetime, timedelta
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework.permissions import IsAuthenticated
-from .authentication import CustomJWTAuthentication
+from rest_framework.permissions import AllowAny
+from apps.core.http import create_session
+from cachetools import TTLCache
+from google.auth import jwt as google_jwt
+import hashlib
+import jwt
+import secrets
+import threading
+import time
 
-GOOGLE_TOKEN_INFO_URL = "https://oauth2.googleapis.com/tokeninfo"
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
 logger = logging.getLogger(__name__)
+User = get_user_model()
+
+# Google 인증서 조회용 keep-alive 세션
+_session = create_session()
+
+# Google 공개 인증서 캐시 (알 수 없는 kid가 들어오면 재조회)
+_google_certs_cache = TTLCache(maxsize=1, ttl=3600)
+_google_certs_lock = threading.Lock()
+# 알 수 없는 kid로 인한 강제 재조회 최소 간격(초) - 임의 토큰으로 외부 요청을 반복 유발하지 못하도록 제한
+GOOGLE_CERTS_MIN_REFRESH_INTERVAL = 300
+_google_certs_fetched_at = 0.0
+
+# 검증된 ID Token 클레임 캐시 (sha256(id_token) -> id_info), 같은 토큰 재시도 시 재검증 생략
+_id_token_cache = TTLCache(maxsize=1000, ttl=60)
+_id_token_cache_lock = threading.Lock()
+
+
+def _get_google_certs(force_refresh=False):
+    """Google ID Token 서명 검증용 공개 인증서 조회 (캐시 사용, 강제 재조회는 최소 간격마다 한 번)"""
+    global _google_certs_fetched_at
+    with _google_certs_lock:
+        certs = _google_certs_cache.get("certs")
+        if certs is not None and force_refresh:
+            if time.monotonic() - _google_certs_fetched_at < GOOGLE_CERTS_MIN_REFRESH_INTERVAL:
+                return certs
+            certs = None
+        if certs is None:
+            resp = _session.get(GOOGLE_CERTS_URL, timeout=10)
+            resp.raise_for_status()
+            certs = resp.json()
+            _google_certs_cache["certs"] = certs
+            _google_certs_fetched_at = time.monotonic()
+        return certs
+
+
+def _verify_google_id_token(id_token):
+    """Google ID Token을 로컬에서 서명 검증하고 클레임 반환 (실패 시 ValueError)"""
+    # audience가 비어 있으면 google_jwt.decode가 aud 검증을 건너뛰므로 검증 자체를 거부
+    if not settings.GOOGLE_CLIENT_ID:
+        raise ImproperlyConfigured("GOOGLE_CLIENT_ID is not set")
+
+    cache_key = hashlib.sha256(id_token.encode()).digest()
+    with _id_token_cache_lock:
+        cached = _id_token_cache.get(cache_key)
+    if cached is not None and cached.get("exp", 0) > time.time():
+        return cached
+
+    try:
+        kid = jwt.get_unverified_header(id_token).get("kid")
+    except jwt.PyJWTError as e:
+        raise ValueError(f"Malformed id_token: {e}") from e
+
+    certs = _get_google_certs()
+    if kid not in certs:
+        certs = _get_google_certs(force_refresh=True)
+
+    id_info = google_jwt.decode(id_token, certs=certs, audience=settings.GOOGLE_CLIENT_ID)
+    if id_info.get("iss") not in GOOGLE_ISSUERS:
+        raise ValueError(f"Wrong issuer: {id_info.get('iss')}")
+
+    with _id_token_cache_lock:
+        _id_token_cache[cache_key] = id_info
+    return id_info
+
 
 class GoogleLoginView(APIView):
+    # 로그인 엔드포인트는 자체적으로 id_token을 검증하므로 JWT 인증 파이프라인 생략
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
     @swagger_auto_schema(
         tags=["oauth"],
         operation_summary="Google OAuth 로그인",
@@ -29,36 +105,33 @@ class GoogleLoginView(APIView):
         if not id_token:
             return Response({"error": "No id_token provided"}, status=400)
 
-        # 1. 구글에 id_token 검증 요청 (timeout 및 예외 처리 추가)
+        # 1. id_token 로컬 서명 검증 (Google 공개 인증서 캐시 사용)
         if settings.DEBUG and id_token == "test_token":
             token_info = {"sub": "test_user_123", "email": "test@example.com"}
             logger.debug("Using test token - bypassing Google verification")
         else:
             try:
-                resp = requests.get(
-                    GOOGLE_TOKEN_INFO_URL,
-                    params={"id_token": id_token},
-                    timeout=10
-                )
-                if resp.status_code != 200:
-                    return Response({"error": "Invalid id_token"}, status=400)
+                token_info = _verify_google_id_token(id_token)
+            except ValueError as e:
+                logger.warning(f"Invalid id_token: {str(e)}")
+                return Response({"error": "Invalid id_token"}, status=400)
             except requests.RequestException as e:
                 logger.error(f"Token verification failed: {str(e)}")
                 return Response({"error": "Token verification failed"}, status=500)
-            token_info = resp.json()
+            except ImproperlyConfigured as e:
+                logger.error(f"Google login misconfigured: {str(e)}")
+                return Response({"error": "Token verification failed"}, status=500)
         sub = token_info.get("sub")
         email = token_info.get("email")
 
         if not sub or not email:
             return Response({"error": "No sub/email in token"}, status=400)
 
-        # 2. 사용자 생성/조회
-        import uuid
-        User = get_user_model()
+        # 2. 사용자 생성/조회 (email은 unique가 아니므로 중복 행이 있으면 첫 번째 사용자 사용)
         user = User.objects.filter(email=email).first()
         if not user:
             user = User.objects.create(
-                username=uuid.uuid4().hex,
+                username=secrets.token_hex(16),
                 email=email
             )
 
@@ -0,0 +1,15 @@
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def generate_avatar_task(uploaded_url, image_digest=None):
+    """업로드된 이미지로 아바타 생성 (응답 본문, 상태코드 반환)"""
+    # views 모듈이 이 작업을 import하므로 순환 import를 피하기 위해 지연 import
+    from .views import generate_avatar_from_url
+
+    logger.info(f"Celery 아바타 생성 작업 시작: {uploaded_url}")
+    body, status_code = generate_avatar_from_url(uploaded_url, image_digest)
+    return [body, status_code]
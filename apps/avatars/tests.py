@@ -1,3 +1,110 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from .tasks import generate_avatar_task
+from .views import (
+    VISIONSTORY_CIRCUIT_OPEN,
+    AvatarTaskStatusView,
+    _register_avatar_task,
+    _visionstory_breaker,
+    generate_avatar_from_url,
+)
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AvatarTaskStatusViewTest(SimpleTestCase):
+    """async=true로 등록한 작업만 등록한 요청자가 조회할 수 있는지 확인"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.view = AvatarTaskStatusView.as_view()
+
+    def _get(self, task_id, token=None):
+        headers = {"HTTP_X_TASK_TOKEN": token} if token else {}
+        request = self.factory.get(f"/avatars/tasks/{task_id}", **headers)
+        return self.view(request, task_id=task_id)
+
+    def _mock_result(self, name, result, ready=True, failed=False):
+        async_result = mock.Mock()
+        async_result.name = name
+        async_result.result = result
+        async_result.status = "SUCCESS" if ready else "PENDING"
+        async_result.ready.return_value = ready
+        async_result.failed.return_value = failed
+        return async_result
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_unknown_task_returns_404(self, async_result):
+        response = self._get("made-up-id", token="anything")
+
+        self.assertEqual(response.status_code, 404)
+        async_result.assert_not_called()
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_wrong_token_returns_404(self, async_result):
+        _register_avatar_task("task-1")
+
+        response = self._get("task-1", token="not-the-token")
+
+        self.assertEqual(response.status_code, 404)
+        async_result.assert_not_called()
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_foreign_task_result_returns_404(self, async_result):
+        token = _register_avatar_task("task-2")
+        async_result.return_value = self._mock_result("apps.core.tasks.test_task", "Hello from Celery!")
+
+        response = self._get("task-2", token=token)
+
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_pending_task_returns_202(self, async_result):
+        token = _register_avatar_task("task-3")
+        async_result.return_value = self._mock_result(None, None, ready=False)
+
+        response = self._get("task-3", token=token)
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "PENDING")
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_ready_task_returns_stored_response(self, async_result):
+        token = _register_avatar_task("task-4")
+        body = {"success": True, "avatar_id": "avatar-1"}
+        async_result.return_value = self._mock_result(generate_avatar_task.name, [body, 200])
+
+        response = self._get("task-4", token=token)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, body)
+
+    @mock.patch("apps.avatars.views.AsyncResult")
+    def test_unavailable_task_result_sets_retry_after(self, async_result):
+        token = _register_avatar_task("task-5")
+        body = {"success": False, "retry_after": 30}
+        async_result.return_value = self._mock_result(generate_avatar_task.name, [body, 503])
+
+        response = self._get("task-5", token=token)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "30")
+
+
+class GenerateAvatarCircuitOpenTest(SimpleTestCase):
+    """VisionStory 회로가 열려 있으면 API 키 오류(500) 대신 503과 재시도 시간을 반환"""
+
+    @mock.patch("apps.avatars.views._delete_uploaded_image")
+    @mock.patch("apps.avatars.views._call_visionstory_api", return_value=VISIONSTORY_CIRCUIT_OPEN)
+    def test_circuit_open_returns_503(self, call_api, delete_uploaded_image):
+        body, status_code = generate_avatar_from_url("https://storage.googleapis.com/bucket/avatars/a.jpg")
+
+        self.assertEqual(status_code, 503)
+        self.assertEqual(body["retry_after"], int(_visionstory_breaker.reset_timeout))
+        delete_uploaded_image.assert_called_once()
@@ -1,6 +1,7 @@
 from django.urls import path
-from .views import AvatarListView
+from .views import AvatarListView, AvatarTaskStatusView
 
 urlpatterns = [
     path('', AvatarListView.as_view(), name='avatars'),  # GET: 아바타 목록 조회, POST: 아바타 생성
-]
\ No newline at end of file
+    path('/tasks/<str:task_id>', AvatarTaskStatusView.as_view(), name='avatar-task-status'),  # GET: 비동기 아바타 생성 작업 상태 조회
+]
@@ -1,8 +1,14 @@
-import os
+import asyncio
+import base64
+import hashlib
+import hmac
+import secrets
 import uuid
 import requests
-from dotenv import load_dotenv
+import httpx
+from functools import lru_cache
 import openai
+from PIL import Image
 from django.conf import settings
 from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
@@ -12,20 +18,102 @@ from rest_framework.permissions import AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from django.core.files.storage import default_storage
+from django.core.cache import cache
 import logging
 import json
+import threading
+from celery.result import AsyncResult
 
 # GCS 업로드 서비스 import
-from apps.gcs.storage_service import upload_image_to_gcs, upload_file_to_gcs, move_gcs_file
+from apps.gcs.storage_service import upload_content_to_gcs, upload_file_to_gcs, delete_gcs_file
 from apps.videos.services.visionstory_service import VisionStoryService
-
-load_dotenv()
+from apps.core.http import CircuitBreaker, create_session
+from .tasks import generate_avatar_task
 
 logger = logging.getLogger(__name__)
 
-VISIONSTORY_API_KEY = os.getenv("VISIONSTORY_API_KEY")
+VISIONSTORY_API_KEY = settings.VISIONSTORY_API_KEY
+VISIONSTORY_USE_MOCK = settings.VISIONSTORY_USE_MOCK
 VISIONSTORY_GENERATE_URL = "https://openapi.visionstory.ai/api/v1/avatar"
 
+# GPT-4o 이미지 분석 프롬프트
+AVATAR_ANALYSIS_PROMPT = (
+    "사용자가 업로드한 이미지를 기반으로, 이미지의 주요 시각적 요소를 요약해 주세요.\n"
+    "특히 다음 항목들을 중심으로 구체적으로 설명해 주세요:\n"
+    "- 이미지에 작품 윤곽을 정확하게 알려주세요\n"
+    "- 이미지의 전체적인 형태나 구조 (예: 원형, 인체, 동물, 조형물 등)\n"
+    "- 이미지의 색감이나 분위기 (예: 고대, 현대, 만화 스타일, 사실적 등)\n"
+    "- 이미지에 작품의 색깔을 정확하게 알려주세요\n"
+    "- 표면 질감이나 재질 (예: 금속, 석재, 유화 느낌 등)\n"
+    "- 눈, 코, 입과 같이 사람처럼 보일 수 있는 요소가 존재하는지 여부\n"
+    "- 이미지의 중심이 되는 대상과 배경의 구성\n"
+    "설명은 최대한 객관적으로, DALL·E가 아바타용 이미지를 생성하는 데 활용할 수 있도록 해 주세요."
+)
+
+# VisionStory 첫 호출과 동시에 폴백용 프롬프트를 미리 생성할지 여부 (성공 시 GPT 호출 1회가 추가로 발생)
+AVATAR_SPECULATIVE_PROMPT = settings.AVATAR_SPECULATIVE_PROMPT
+
+# 이미지 분석 모델 (앞 모델이 실패하거나 빈 응답이면 다음 모델로 재시도)
+AVATAR_PROMPT_MODELS = ("gpt-4o-mini", "gpt-4o")
+
+# DALL·E 3 기본 프롬프트 (안전하고 명확한 아바타 생성 지시)
+DALLE_SAFE_PROMPT = (
+    "업로드한 이미지를 기반으로 원본의 형태, 구조, 질감을 최대한 그대로 유지해 주세요.\n"
+    "새로운 사람을 생성하지 말고, 기존 이미지 위에 눈, 코, 입을 자연스럽게 삽입하거나 선명하게 보완해 주세요.\n"
+    "AI가 얼굴로 인식할 수 있도록 눈, 코, 입은 명확하게 표현하고, 어깨 라인을 약간 추가해도 괜찮습니다.\n"
+    "결과물이 애니메이션 스타일이더라도 괜찮지만, 반드시 원본 이미지의 구조와 분위기를 유지해야 합니다."
+    "눈은 반드시 2개있어야하고 코는 1개있어야하고 입은 1개있어야합니다."
+    "어깨 라인은 반드시 있어야합니다."
+    "반드시 정면을 바라봐야합니다"
+    "사물인경우 그냥 이미지설명을 바탕으로 작품모양과 색깔을 유지한 얼굴을 만들어주세요"
+)
+
+# 아바타 생성용 업로드 이미지 최대 크기
+AVATAR_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# 아바타 생성용 이미지 최소 가로/세로 크기 (px)
+AVATAR_MIN_IMAGE_SIZE = 128
+
+# 프롬프트/모델 변경 시 올려서 이전 DALL·E 결과 캐시를 무효화
+AVATAR_PROMPT_VERSION = 2
+
+# 원본 이미지 해시 -> DALL·E 결과 캐시 유지 시간 (초)
+AVATAR_DALLE_CACHE_TTL = settings.AVATAR_DALLE_CACHE_TTL
+
+# 원본 이미지 해시 -> 아바타 생성 성공 응답 캐시 유지 시간 (초, 0이면 비활성화)
+AVATAR_RESULT_CACHE_TTL = settings.AVATAR_RESULT_CACHE_TTL
+
+# async=true로 등록한 아바타 작업의 상태 조회 허용 기간 (초)
+AVATAR_TASK_TTL = settings.AVATAR_TASK_TTL
+
+# VisionStory 연결/응답 대기 시간 (connect, read)
+VISIONSTORY_TIMEOUT = (3.05, 30)
+
+# VisionStory 호출용 keep-alive 세션 (인증 헤더는 세션에 한 번만 설정)
+# 일시적 장애(429/502/503)는 비싼 DALL·E 폴백 대신 재시도 (504는 이미 처리됐을 수 있어 제외)
+_session = create_session(
+    pool_connections=16,
+    pool_maxsize=32,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503),
+    allowed_methods=("GET", "POST"),
+)
+if VISIONSTORY_API_KEY:
+    _session.headers.update({"X-API-Key": VISIONSTORY_API_KEY, "Content-Type": "application/json"})
+
+# VisionStory 장애(네트워크 에러/5xx) 시 타임아웃까지 기다리지 않도록 호출 차단
+_visionstory_breaker = CircuitBreaker(fail_max=5, reset_timeout=30)
+
+# 회로 차단으로 호출을 생략했음을 나타내는 값 (API 키 누락 등의 None과 구분)
+VISIONSTORY_CIRCUIT_OPEN = object()
+
+# 외부 API별 동시 호출 수 제한 (버스트 시 업스트림 rate limit 대신 프로세스 안에서 순서대로 대기)
+_visionstory_slots = threading.BoundedSemaphore(settings.VISIONSTORY_MAX_CONCURRENCY)
+_dalle_slots = threading.BoundedSemaphore(settings.DALLE_MAX_CONCURRENCY)
+
+# DALL·E 3 이미지 생성 응답 대기 시간 (초, SDK 기본값 600초 대신)
+DALLE_TIMEOUT = 90
+
 def _call_visionstory_api(image_url):
     # API 키 확인
     if not VISIONSTORY_API_KEY:
@@ -34,113 +122,151 @@ def _call_visionstory_api(image_url):
     
     # API 키 일부만 로깅 (보안상)
     api_key_preview = VISIONSTORY_API_KEY[:8] + "..." if len(VISIONSTORY_API_KEY) > 8 else "None"
-    logger.info(f"VisionStory API 키 확인: {api_key_preview}")
+    logger.debug("VisionStory API 키 확인: %s", api_key_preview)
+    
+    if not _visionstory_breaker.allow():
+        logger.warning(f"VisionStory 회로 차단 중 - 호출 생략: {image_url}")
+        return VISIONSTORY_CIRCUIT_OPEN
     
-    headers = {
-        "X-API-Key": VISIONSTORY_API_KEY,
-        "Content-Type": "application/json"
-    }
     payload = {"img_url": image_url}
     
-    logger.info(f"VisionStory API 호출 시작: {image_url}")
-    logger.info(f"API URL: {VISIONSTORY_GENERATE_URL}")
-    logger.info(f"요청 헤더: {{k: v if k != 'X-API-Key' else '***' for k, v in headers.items()}}")
-    logger.info(f"요청 페이로드: {payload}")
+    logger.info("VisionStory API 호출 시작: %s", image_url)
+    logger.debug("API URL: %s, 요청 페이로드: %s", VISIONSTORY_GENERATE_URL, payload)
     
     try:
-        response = requests.post(
-            VISIONSTORY_GENERATE_URL,
-            json=payload,
-            headers=headers,
-            timeout=30  # timeout 증가
-        )
-        logger.info(f"VisionStory 응답({image_url}): {response.status_code}")
-        logger.info(f"VisionStory 응답 내용: {response.text}")
+        with _visionstory_slots:
+            response = _session.post(
+                VISIONSTORY_GENERATE_URL,
+                json=payload,
+                timeout=VISIONSTORY_TIMEOUT
+            )
+        logger.info("VisionStory 응답(%s): %s", image_url, response.status_code)
+        # response.text는 인자 평가 시점에 본문을 디코딩하므로 DEBUG일 때만 접근
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("VisionStory 응답 내용: %s", response.text)
+        # 4xx는 이미지 문제(폴백 대상)이므로 서버 오류만 장애로 집계
+        if response.status_code >= 500:
+            _visionstory_breaker.record_failure()
+        else:
+            _visionstory_breaker.record_success()
         return response
     except requests.exceptions.Timeout:
         logger.error(f"VisionStory API 호출 타임아웃: {image_url}")
+        _visionstory_breaker.record_failure()
         return None
     except requests.exceptions.RequestException as e:
         logger.error(f"VisionStory API 호출 네트워크 에러: {e}")
+        _visionstory_breaker.record_failure()
         return None
     except Exception as e:
         logger.error(f"VisionStory API 호출 예상치 못한 에러: {e}")
         return None
 
-def _generate_prompt(image_url):
-    # OpenAI 클라이언트 초기화 (최신 방식)
-    client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    prompt = (
-        "사용자가 업로드한 이미지를 기반으로, 이미지의 주요 시각적 요소를 요약해 주세요.\n"
-        "특히 다음 항목들을 중심으로 구체적으로 설명해 주세요:\n"
-        "- 이미지에 작품 윤곽을 정확하게 알려주세요\n"
-        "- 이미지의 전체적인 형태나 구조 (예: 원형, 인체, 동물, 조형물 등)\n"
-        "- 이미지의 색감이나 분위기 (예: 고대, 현대, 만화 스타일, 사실적 등)\n"
-        "- 이미지에 작품의 색깔을 정확하게 알려주세요\n"
-        "- 표면 질감이나 재질 (예: 금속, 석재, 유화 느낌 등)\n"
-        "- 눈, 코, 입과 같이 사람처럼 보일 수 있는 요소가 존재하는지 여부\n"
-        "- 이미지의 중심이 되는 대상과 배경의 구성\n"
-        "설명은 최대한 객관적으로, DALL·E가 아바타용 이미지를 생성하는 데 활용할 수 있도록 해 주세요."
-)
-    try:
-        gpt_response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {"type": "image_url", "image_url": {"url": image_url}}
-                    ]
-                }
-            ],
-            max_tokens=500
-        )
-        result = gpt_response.choices[0].message.content if gpt_response.choices and gpt_response.choices[0].message.content else None
-        logger.info(f"GPT-4o 프롬프트 결과: {result}")
-        return result
-    except Exception as e:
-        logger.error(f"프롬프트 생성 에러: {e}")
-        return None
+async def _generate_prompt(image_url):
+    # 이벤트 루프마다 클라이언트를 새로 열고 닫음 (asyncio.run 간 커넥션 공유 방지)
+    # 호출마다 새 커넥션이라 HTTP/2 다중화 이점이 없으므로 기본 HTTP/1.1 클라이언트 사용
+    async with openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY) as client:
+        for model in AVATAR_PROMPT_MODELS:
+            try:
+                gpt_response = await client.chat.completions.create(
+                    model=model,
+                    # 고정 지시문을 앞(system)에, 요청마다 바뀌는 이미지를 뒤에 두어 OpenAI 프롬프트 캐시 접두사를 유지
+                    messages=[
+                        {"role": "system", "content": AVATAR_ANALYSIS_PROMPT},
+                        {
+                            "role": "user",
+                            "content": [
+                                # 형태/색감 요약에는 저해상도(512px, 고정 토큰)로 충분
+                                {"type": "image_url", "image_url": {"url": image_url, "detail": "low"}}
+                            ]
+                        }
+                    ],
+                    max_tokens=300
+                )
+                result = gpt_response.choices[0].message.content if gpt_response.choices and gpt_response.choices[0].message.content else None
+                logger.debug("%s 프롬프트 결과: %s", model, result)
+                if gpt_response.usage and gpt_response.usage.prompt_tokens_details:
+                    logger.debug("%s 캐시된 입력 토큰: %s", model, gpt_response.usage.prompt_tokens_details.cached_tokens)
+                if result:
+                    return result
+                logger.warning(f"{model} 프롬프트 결과가 비어 있음")
+            except Exception as e:
+                logger.error(f"프롬프트 생성 에러 ({model}): {e}")
+    return None
 
-def _generate_dalle_image(prompt_text):
-    # OpenAI 클라이언트 초기화 (최신 방식)  
-    client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-    
-    # 안전하고 명확한 기본 프롬프트
-    safe_prompt = (
-        "업로드한 이미지를 기반으로 원본의 형태, 구조, 질감을 최대한 그대로 유지해 주세요.\n"
-            "새로운 사람을 생성하지 말고, 기존 이미지 위에 눈, 코, 입을 자연스럽게 삽입하거나 선명하게 보완해 주세요.\n"
-            "AI가 얼굴로 인식할 수 있도록 눈, 코, 입은 명확하게 표현하고, 어깨 라인을 약간 추가해도 괜찮습니다.\n"
-            "결과물이 애니메이션 스타일이더라도 괜찮지만, 반드시 원본 이미지의 구조와 분위기를 유지해야 합니다."
-            "눈은 반드시 2개있어야하고 코는 1개있어야하고 입은 1개있어야합니다."
-            "어깨 라인은 반드시 있어야합니다."
-            "반드시 정면을 바라봐야합니다"
-            "사물인경우 그냥 이미지설명을 바탕으로 작품모양과 색깔을 유지한 얼굴을 만들어주세요"
+async def _call_visionstory_with_speculative_prompt(image_url, speculate=True):
+    """
+    VisionStory 호출과 GPT-4o 프롬프트 생성을 동시에 시작
+
+    VisionStory가 실패하면 DALL·E 폴백에 필요한 프롬프트가 이미 준비되어 있어
+    전체 대기 시간이 두 호출의 합이 아닌 최댓값이 됩니다. 성공 시 프롬프트 작업은 취소합니다.
+
+    Args:
+        image_url: VisionStory에 전달할 이미지 URL
+        speculate: False면 프롬프트를 생성하지 않음 (캐시된 DALL·E 결과가 있는 경우)
+
+    Returns:
+        tuple: (VisionStory 응답 / None / VISIONSTORY_CIRCUIT_OPEN, 프롬프트 또는 None)
+    """
+    if not speculate:
+        return await asyncio.to_thread(_call_visionstory_api, image_url), None
+
+    prompt_task = asyncio.create_task(_generate_prompt(image_url))
+    response = await asyncio.to_thread(_call_visionstory_api, image_url)
+
+    if response is None or response is VISIONSTORY_CIRCUIT_OPEN or response.status_code == 200:
+        prompt_task.cancel()
+        return response, None
+
+    return response, await prompt_task
+
+@lru_cache(maxsize=1)
+def _get_openai_client():
+    """DALL·E 호출용 OpenAI 클라이언트 (첫 사용 시 한 번 생성해 HTTP/2 커넥션 재사용)"""
+    return openai.OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        max_retries=2,
+        # DALL·E 호출은 간헐적이므로 유휴 커넥션을 기본값(5초)보다 오래 유지해 TLS 재연결을 줄임
+        http_client=httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0),
+        ),
     )
+
+def _generate_dalle_image(prompt_text):
+    client = _get_openai_client()
     
-    # 사용자 프롬프트가 있으면 결합, 없으면 기본 프롬프트 사용
-    final_prompt = f"{prompt_text} {safe_prompt}" if prompt_text else safe_prompt
+    # 사용자 프롬프트가 있으면 고정 기본 프롬프트 뒤에 결합, 없으면 기본 프롬프트만 사용
+    final_prompt = f"{DALLE_SAFE_PROMPT} {prompt_text}" if prompt_text else DALLE_SAFE_PROMPT
     
     try:
-        dalle_response = client.images.generate(
-            model="dall-e-3",
-            prompt=final_prompt,
-            n=1,
-            size="1024x1024"
-        )
-        url = dalle_response.data[0].url if dalle_response.data and dalle_response.data[0].url else None
-        logger.info(f"DALL·E 3 이미지 URL: {url}")
-        return url
+        with _dalle_slots:
+            dalle_response = client.images.generate(
+                model="dall-e-3",
+                prompt=final_prompt,
+                n=1,
+                size="1024x1024",
+                # 만료되는 이미지 URL을 다시 내려받지 않도록 응답에 이미지 본문을 직접 포함
+                response_format="b64_json",
+                timeout=DALLE_TIMEOUT
+            )
+        b64_image = dalle_response.data[0].b64_json if dalle_response.data and dalle_response.data[0].b64_json else None
+        if not b64_image:
+            logger.error("DALL·E 3 응답에 이미지가 없습니다.")
+            return None
+        image_bytes = base64.b64decode(b64_image)
+        logger.info(f"DALL·E 3 이미지 생성 완료: {len(image_bytes)} bytes")
+        return image_bytes
     except Exception as e:
         logger.error(f"DALL·E 3 이미지 생성 에러: {e}")
         return None
 
 # GCS 업로드 함수는 apps.gcs.storage_service로 이동됨
 # 기존 함수명 호환성을 위한 래퍼 함수
-def _upload_image_to_gcs(image_url):
-    """DALL·E 이미지 URL을 GCS에 업로드 (기존 호환성)"""
-    result = upload_image_to_gcs(image_url, folder="avatars")
+def _upload_image_to_gcs(image_bytes):
+    """DALL·E 이미지 본문을 GCS에 업로드"""
+    result = upload_content_to_gcs(image_bytes, "dalle.png", folder="avatars")
     if result:
         logger.info(f"GCS 업로드된 DALL·E 3 이미지 URL: {result}")
         return result
@@ -148,9 +274,307 @@ def _upload_image_to_gcs(image_url):
         logger.error("GCS 업로드 에러: 업로드 실패")
         return None
 
+def _check_image_quality(image_file):
+    """업로드 이미지 사전 검사 (문제가 있으면 사용자에게 보여줄 메시지, 없으면 None)"""
+    try:
+        image_file.seek(0)
+        with Image.open(image_file) as image:
+            width, height = image.size
+            image.verify()
+    except Exception as e:
+        logger.warning(f"이미지 디코딩 실패: {e}")
+        return "이미지 파일을 읽을 수 없습니다. 다른 이미지를 업로드해주세요."
+    finally:
+        image_file.seek(0)
+
+    if min(width, height) < AVATAR_MIN_IMAGE_SIZE:
+        return f"이미지가 너무 작습니다. 가로세로 {AVATAR_MIN_IMAGE_SIZE}px 이상의 이미지를 업로드해주세요."
+    return None
+
+def _delete_uploaded_image(uploaded_url):
+    """결과로 쓰이지 않는 업로드 이미지를 백그라운드에서 삭제 (응답을 지연시키지 않음)"""
+    threading.Thread(target=delete_gcs_file, args=(uploaded_url,), daemon=True).start()
+
+def _dalle_cache_key(image_digest):
+    return f"avatar:dalle:{image_digest}:{AVATAR_PROMPT_VERSION}"
+
+def _get_cached_dalle_result(image_digest):
+    """이미지 해시로 캐시된 DALL·E 결과 조회 (캐시 장애 시 None)"""
+    if not image_digest:
+        return None
+    try:
+        return cache.get(_dalle_cache_key(image_digest))
+    except Exception as e:
+        logger.warning(f"DALL·E 결과 캐시 조회 실패: {e}")
+        return None
+
+def _cache_dalle_result(image_digest, gcs_url, prompt):
+    """VisionStory가 받아들인 DALL·E 이미지를 원본 이미지 해시로 캐시"""
+    if not image_digest:
+        return
+    try:
+        cache.set(_dalle_cache_key(image_digest), {"gcs_url": gcs_url, "prompt": prompt}, timeout=AVATAR_DALLE_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"DALL·E 결과 캐시 저장 실패: {e}")
+
+def _avatar_cache_key(image_digest):
+    return f"avatar:{image_digest}"
+
+def _get_cached_avatar(image_digest):
+    """이미지 해시로 캐시된 아바타 생성 성공 응답 조회 (캐시 장애 시 None)"""
+    if not image_digest or not AVATAR_RESULT_CACHE_TTL:
+        return None
+    try:
+        return cache.get(_avatar_cache_key(image_digest))
+    except Exception as e:
+        logger.warning(f"아바타 결과 캐시 조회 실패: {e}")
+        return None
+
+def _cache_avatar_result(image_digest, body):
+    """아바타 생성 성공 응답을 원본 이미지 해시로 캐시 (재시도/중복 업로드 시 외부 API 호출 생략)"""
+    if not image_digest or not AVATAR_RESULT_CACHE_TTL:
+        return
+    try:
+        cache.set(_avatar_cache_key(image_digest), body, timeout=AVATAR_RESULT_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"아바타 결과 캐시 저장 실패: {e}")
+
+def _retry_after_headers(body):
+    """일시적 사용 불가 응답이면 Retry-After 헤더 생성"""
+    retry_after = body.get("retry_after")
+    return {"Retry-After": str(retry_after)} if retry_after else {}
+
+def _avatar_task_cache_key(task_id):
+    return f"avatar:task:{task_id}"
+
+def _register_avatar_task(task_id):
+    """작업 ID를 요청자에게만 발급하는 조회 토큰과 묶어 저장하고 토큰 반환 (원본 토큰은 저장하지 않음)"""
+    token = secrets.token_urlsafe(16)
+    token_digest = hashlib.sha256(token.encode()).hexdigest()
+    cache.set(_avatar_task_cache_key(task_id), token_digest, timeout=AVATAR_TASK_TTL)
+    return token
+
+def _is_avatar_task_owner(task_id, token):
+    """조회 토큰이 작업 등록 시 발급한 토큰과 일치하는지 확인 (미등록/만료 작업이면 False)"""
+    if not token:
+        return False
+    token_digest = cache.get(_avatar_task_cache_key(task_id))
+    if token_digest is None:
+        return False
+    return hmac.compare_digest(token_digest, hashlib.sha256(token.encode()).hexdigest())
+
+
+def generate_avatar_from_url(uploaded_url, image_digest=None):
+    """
+    업로드된 이미지로 아바타 생성 (VisionStory 실패 시 GPT-4o + DALL·E 3로 재시도)
+
+    뷰와 Celery 작업에서 함께 사용하므로 Response 대신 (응답 본문, 상태코드)를 반환합니다.
+
+    Args:
+        uploaded_url: avatars 폴더에 업로드된 이미지 URL (원본 이미지를 쓰지 않게 되면 삭제됨)
+        image_digest: 원본 이미지의 sha256 (아바타/DALL-E 3 결과 캐시 키, 없으면 캐시 미사용)
+
+    Returns:
+        tuple: (응답 본문 dict, HTTP 상태코드)
+    """
+    # VisionStory API 호출 (실패 대비 GPT-4o 프롬프트를 동시에 생성)
+    logger.info(f"VisionStory API 호출 시작: uploaded_url={uploaded_url}")
+    # 같은 이미지로 이미 DALL-E 3 이미지를 만든 적이 있으면 프롬프트를 미리 생성하지 않음
+    cached = _get_cached_dalle_result(image_digest)
+    speculate = AVATAR_SPECULATIVE_PROMPT and cached is None
+    response, prompt = asyncio.run(_call_visionstory_with_speculative_prompt(uploaded_url, speculate=speculate))
+    if response is VISIONSTORY_CIRCUIT_OPEN:
+        # VisionStory 장애로 회로가 열린 상태 - 설정 문제가 아니므로 잠시 후 재시도 안내
+        _delete_uploaded_image(uploaded_url)
+        return {
+            "success": False,
+            "error": "VisionStory 일시적 사용 불가",
+            "message": "아바타 생성 서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요.",
+            "retry_required": True,
+            "retry_after": int(_visionstory_breaker.reset_timeout)
+        }, status.HTTP_503_SERVICE_UNAVAILABLE
+    if response is None:
+        logger.error("VisionStory API 호출 실패: response가 None")
+        _delete_uploaded_image(uploaded_url)
+        return {
+            "success": False,
+            "error": "VisionStory API 호출 실패",
+            "message": "VisionStory API 호출에 실패했습니다. API 키 설정을 확인해주세요.",
+            "retry_required": True
+        }, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+    logger.info(f"VisionStory API 응답 상태코드: {response.status_code}")
+    if response.status_code == 200:
+        result = response.json()
+        avatar_id = result.get("data", {}).get("avatar_id")
+
+        if avatar_id:
+            # 처음부터 영구 경로(avatars/)에 업로드했으므로 이동 없이 그대로 사용
+            logger.info(f"VisionStory 아바타 생성 성공: {avatar_id}")
+
+            body = {
+                "success": True,
+                "avatar_id": avatar_id,
+                "thumbnail_url": result.get("data", {}).get("thumbnail_url"),
+                "uploaded_url": uploaded_url,
+                "message": result.get("message", "아바타 생성 성공"),
+                "used_dalle": False  # 원본 이미지로 성공
+            }
+            _cache_avatar_result(image_digest, body)
+            return body, status.HTTP_200_OK
+        else:
+            _delete_uploaded_image(uploaded_url)
+            return {
+                "success": False,
+                "error": "아바타 생성 실패",
+                "message": "VisionStory에서 아바타 ID를 받지 못했습니다.",
+                "retry_required": True
+            }, status.HTTP_400_BAD_REQUEST
+    else:
+        # VisionStory API 실패 - DALL-E 3로 새 이미지 생성 시도
+        logger.info(f"VisionStory 아바타 생성 실패 (상태코드: {response.status_code}), DALL-E 3로 새 이미지 생성 시도")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("VisionStory 실패 응답: %s", response.text)
+
+        # 프롬프트를 미리 생성하지 않았다면 지금 생성
+        if not cached and not speculate:
+            prompt = asyncio.run(_generate_prompt(uploaded_url))
+
+        # 원본 이미지는 프롬프트 생성에만 쓰였고 결과로 반환되지 않으므로 삭제
+        _delete_uploaded_image(uploaded_url)
+
+        if cached:
+            # 캐시된 DALL-E 3 이미지가 있으면 프롬프트/이미지 생성 생략
+            logger.info(f"캐시된 DALL-E 3 이미지 사용: {cached['gcs_url']}")
+            dalle_gcs_url = cached["gcs_url"]
+            prompt = cached["prompt"]
+        else:
+            # 원본 이미지로 생성한 프롬프트 (VisionStory 호출과 동시에 생성됨)
+            if not prompt:
+                logger.error("GPT-4o 프롬프트 생성 실패")
+                return {
+                    "success": False,
+                    "error": "프롬프트 생성 실패",
+                    "message": "이미지 분석에 실패했습니다. 다른 이미지를 시도해주세요.",
+                    "retry_required": True
+                }, status.HTTP_400_BAD_REQUEST
+
+            # DALL-E 3로 새 이미지 생성
+            logger.info("DALL-E 3 이미지 생성 시작")
+            logger.debug("생성할 프롬프트: %s", prompt)
+            dalle_image = _generate_dalle_image(prompt)
+            if not dalle_image:
+                logger.error("DALL-E 3 이미지 생성 실패")
+                return {
+                    "success": False,
+                    "error": "DALL-E 3 이미지 생성 실패",
+                    "message": "새 이미지 생성에 실패했습니다. 다른 이미지를 시도해주세요.",
+                    "retry_required": True
+                }, status.HTTP_400_BAD_REQUEST
+
+            # 생성된 이미지를 GCS에 업로드
+            logger.info("DALL-E 3 생성 이미지 GCS 업로드 시작")
+            dalle_gcs_url = _upload_image_to_gcs(dalle_image)
+            if not dalle_gcs_url:
+                logger.error("DALL-E 3 생성 이미지 GCS 업로드 실패")
+                return {
+                    "success": False,
+                    "error": "DALL-E 3 이미지 업로드 실패",
+                    "message": "생성된 이미지 업로드에 실패했습니다.",
+                    "retry_required": True
+                }, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        # DALL-E 3로 생성된 이미지로 VisionStory 다시 시도
+        logger.info("DALL-E 3 생성 이미지로 VisionStory 재시도")
+        retry_response = _call_visionstory_api(dalle_gcs_url)
+
+        if retry_response and retry_response.status_code == 200:
+            # 재시도 성공
+            result = retry_response.json()
+            avatar_id = result.get("data", {}).get("avatar_id")
+
+            if avatar_id:
+                logger.info(f"DALL-E 3 이미지로 VisionStory 아바타 생성 성공: {avatar_id}")
+                _cache_dalle_result(image_digest, dalle_gcs_url, prompt)
+
+                body = {
+                    "success": True,
+                    "avatar_id": avatar_id,
+                    "thumbnail_url": result.get("data", {}).get("thumbnail_url"),
+                    "uploaded_url": dalle_gcs_url,
+                    "message": "DALL-E 3로 생성된 이미지로 아바타 생성 성공",
+                    "used_dalle": True  # DALL-E 3 사용 여부 표시
+                }
+                _cache_avatar_result(image_digest, body)
+                return body, status.HTTP_200_OK
+            else:
+                return {
+                    "success": False,
+                    "error": "DALL-E 3 이미지 아바타 생성 실패",
+                    "message": "새 이미지로도 아바타 생성에 실패했습니다. 다른 이미지를 시도해주세요.",
+                    "retry_required": True
+                }, status.HTTP_400_BAD_REQUEST
+        else:
+            # DALL-E 3 이미지로도 실패
+            error_message = "원본 이미지와 새로 생성된 이미지 모두로 아바타 생성에 실패했습니다."
+            if retry_response:
+                try:
+                    error_data = retry_response.json()
+                    error_message = error_data.get("message", error_message)
+                except (json.JSONDecodeError, KeyError) as e:
+                    logger.warning(f"재시도 응답 파싱 실패: {e}")
+
+            return {
+                "success": False,
+                "error": "VisionStory API 오류 (DALL-E 3 재시도 포함)",
+                "message": error_message,
+                "retry_required": True,
+                "suggestion": "더 선명하고 정면을 바라보는 인물 사진을 업로드해주세요."
+            }, status.HTTP_400_BAD_REQUEST
+
+
+# 아바타 생성 성공 응답
+AVATAR_CREATE_SUCCESS_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True),
+        'avatar_id': openapi.Schema(type=openapi.TYPE_STRING, description='생성된 아바타 ID'),
+        'thumbnail_url': openapi.Schema(type=openapi.TYPE_STRING, description='아바타 썸네일 URL'),
+        'uploaded_url': openapi.Schema(type=openapi.TYPE_STRING, description='업로드된 원본 이미지 URL'),
+        'message': openapi.Schema(type=openapi.TYPE_STRING, description='성공 메시지'),
+        'used_dalle': openapi.Schema(type=openapi.TYPE_BOOLEAN, description='DALL-E 3 사용 여부', example=False),
+    }
+)
+
+# 아바타 생성 실패 응답 (다른 이미지 필요)
+AVATAR_CREATE_FAILURE_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
+        'error': openapi.Schema(type=openapi.TYPE_STRING, description='에러 타입'),
+        'message': openapi.Schema(type=openapi.TYPE_STRING, description='사용자에게 보여줄 메시지'),
+        'retry_required': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True, description='새 이미지 업로드 필요'),
+        'suggestion': openapi.Schema(type=openapi.TYPE_STRING, description='개선 제안'),
+    }
+)
+
+# 아바타 생성 서버 오류 응답
+AVATAR_SERVER_ERROR_SCHEMA = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
+        'error': openapi.Schema(type=openapi.TYPE_STRING, description='에러 타입'),
+        'message': openapi.Schema(type=openapi.TYPE_STRING, description='사용자에게 보여줄 메시지'),
+        'retry_required': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True, description='새 이미지 업로드 필요'),
+        'detail': openapi.Schema(type=openapi.TYPE_STRING, description='상세 에러 정보'),
+        'retry_after': openapi.Schema(type=openapi.TYPE_INTEGER, description='재시도까지 대기 시간 (초, 503 응답에만 포함)'),
+    }
+)
+
 
 class AvatarListView(APIView):
     """아바타 목록 조회 및 생성 API"""
+    authentication_classes = []  # 인증이 필요 없는 엔드포인트 - JWT 검증 생략
     permission_classes = [AllowAny]
     parser_classes = [MultiPartParser]  # 파일 업로드를 위한 파서 추가
     
@@ -239,48 +663,31 @@ class AvatarListView(APIView):
                 type=openapi.TYPE_FILE,
                 description="업로드할 이미지 파일 (선명하고 정면을 바라보는 인물 사진 권장)",
                 required=True
+            ),
+            openapi.Parameter(
+                name="async",
+                in_=openapi.IN_FORM,
+                type=openapi.TYPE_BOOLEAN,
+                description="true면 작업을 등록하고 202와 task_id, task_token을 즉시 반환합니다 (X-Task-Token 헤더와 함께 /avatars/tasks/{task_id}로 결과 조회)",
+                required=False
             )
         ],
         responses={
             200: openapi.Response(
                 description="아바타 생성 성공",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True),
-                        'avatar_id': openapi.Schema(type=openapi.TYPE_STRING, description='생성된 아바타 ID'),
-                        'thumbnail_url': openapi.Schema(type=openapi.TYPE_STRING, description='아바타 썸네일 URL'),
-                        'uploaded_url': openapi.Schema(type=openapi.TYPE_STRING, description='업로드된 원본 이미지 URL'),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING, description='성공 메시지'),
-                        'used_dalle': openapi.Schema(type=openapi.TYPE_BOOLEAN, description='DALL-E 3 사용 여부', example=False),
-                    }
-                )
+                schema=AVATAR_CREATE_SUCCESS_SCHEMA
             ),
             400: openapi.Response(
                 description="아바타 생성 실패 - 다른 이미지 필요",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
-                        'error': openapi.Schema(type=openapi.TYPE_STRING, description='에러 타입'),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING, description='사용자에게 보여줄 메시지'),
-                        'retry_required': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True, description='새 이미지 업로드 필요'),
-                        'suggestion': openapi.Schema(type=openapi.TYPE_STRING, description='개선 제안'),
-                    }
-                )
+                schema=AVATAR_CREATE_FAILURE_SCHEMA
             ),
             500: openapi.Response(
                 description="서버 오류",
-                schema=openapi.Schema(
-                    type=openapi.TYPE_OBJECT,
-                    properties={
-                        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=False),
-                        'error': openapi.Schema(type=openapi.TYPE_STRING, description='에러 타입'),
-                        'message': openapi.Schema(type=openapi.TYPE_STRING, description='사용자에게 보여줄 메시지'),
-                        'retry_required': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True, description='새 이미지 업로드 필요'),
-                        'detail': openapi.Schema(type=openapi.TYPE_STRING, description='상세 에러 정보'),
-                    }
-                )
+                schema=AVATAR_SERVER_ERROR_SCHEMA
+            ),
+            503: openapi.Response(
+                description="VisionStory 일시적 사용 불가 - Retry-After(초) 후 재시도",
+                schema=AVATAR_SERVER_ERROR_SCHEMA
             )
         },
     )
@@ -294,20 +701,17 @@ class AvatarListView(APIView):
                 "retry_required": True
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # 모킹 모드 확인 (기본값을 false로 변경)
-        use_mock = os.getenv("VISIONSTORY_USE_MOCK", "false").lower() == "true"
-        
-        if use_mock:
-            # 모킹 모드에서는 임시로 파일을 메모리에 저장하여 VisionStory API 호출
-            import tempfile
-            
-            # 임시 파일 생성
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as temp_file:
-                for chunk in image_file.chunks():
-                    temp_file.write(chunk)
-                temp_file_path = temp_file.name
-            
-            # 임시 파일을 VisionStory API에 전달 (실제로는 모킹이므로 호출하지 않음)
+        if image_file.size > AVATAR_MAX_UPLOAD_SIZE:
+            return Response({
+                "success": False,
+                "error": "이미지 파일이 너무 큽니다.",
+                "message": f"{AVATAR_MAX_UPLOAD_SIZE // (1024 * 1024)}MB 이하의 이미지를 업로드해주세요.",
+                "retry_required": True
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # 모킹 모드 확인
+        if VISIONSTORY_USE_MOCK:
+            # 모킹 모드에서는 VisionStory API를 호출하지 않음
             logger.info("🚫 모킹 모드 활성화 - 모의 아바타 데이터 반환")
             import time
             mock_avatar_id = f"mock_avatar_{int(time.time())}"
@@ -315,9 +719,6 @@ class AvatarListView(APIView):
             # 모킹 모드에서도 성공 후 GCS에 저장
             file_url = upload_file_to_gcs(image_file, folder="avatars")
             
-            # 임시 파일 삭제
-            os.unlink(temp_file_path)
-            
             return Response({
                 "success": True,
                 "avatar_id": mock_avatar_id,
@@ -327,162 +728,136 @@ class AvatarListView(APIView):
                 "used_dalle": False  # 모킹 모드에서는 DALL-E 3 사용 안함
             }, status=status.HTTP_200_OK)
         
-        # 실제 VisionStory API 호출을 위해 임시로 파일을 메모리에 저장
-        import tempfile
-        
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as temp_file:
-            for chunk in image_file.chunks():
-                temp_file.write(chunk)
-            temp_file_path = temp_file.name
-        
-        try:
-            # 임시 파일을 VisionStory API에 전달 (실제로는 URL이 필요하므로 임시 업로드)
-            # 실제 구현에서는 임시 스토리지나 직접 파일 업로드 방식을 사용해야 함
-            # 여기서는 간단히 임시 GCS 업로드 후 VisionStory API 호출
-            
-            # 임시 GCS 업로드 (VisionStory API 호출용)
-            temp_file_url = upload_file_to_gcs(image_file, folder="temp_avatars")
-            if not temp_file_url:
-                return Response({
-                    "success": False,
-                    "error": "임시 이미지 업로드 실패",
-                    "message": "이미지를 임시 업로드할 수 없습니다.",
-                    "retry_required": True
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-            # VisionStory API 호출
-            logger.info(f"VisionStory API 호출 시작: temp_file_url={temp_file_url}")
-            response = _call_visionstory_api(temp_file_url)
-            logger.info(f"_call_visionstory_api 반환값: {response}")
-            logger.info(f"response 타입: {type(response)}")
-            if response is None:
-                logger.error("VisionStory API 호출 실패: response가 None")
-                return Response({
-                    "success": False,
-                    "error": "VisionStory API 호출 실패",
-                    "message": "VisionStory API 호출에 실패했습니다. API 키 설정을 확인해주세요.",
-                    "retry_required": True
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            
-            logger.info(f"VisionStory API 응답 상태코드: {response.status_code}")
-            if response.status_code == 200:
-                result = response.json()
-                avatar_id = result.get("data", {}).get("avatar_id")
-                
-                if avatar_id:
-                    # VisionStory API 성공 후 영구 GCS 저장
-                    logger.info(f"VisionStory 아바타 생성 성공: {avatar_id}, 영구 GCS 저장 시작")
-                    
-                    # 임시 폴더에서 영구 폴더로 파일 이동 (재업로드 대신)
-                    file_url = move_gcs_file(temp_file_url, "temp_avatars", "avatars")
-                    if not file_url:
-                        logger.warning("GCS 파일 이동 실패, 임시 URL 사용")
-                        file_url = temp_file_url
-                    
-                    return Response({
-                        "success": True,
-                        "avatar_id": avatar_id,
-                        "thumbnail_url": result.get("data", {}).get("thumbnail_url"),
-                        "uploaded_url": file_url,
-                        "message": result.get("message", "아바타 생성 성공"),
-                        "used_dalle": False  # 원본 이미지로 성공
-                    }, status=status.HTTP_200_OK)
-                else:
-                    return Response({
-                        "success": False,
-                        "error": "아바타 생성 실패",
-                        "message": "VisionStory에서 아바타 ID를 받지 못했습니다.",
-                        "retry_required": True
-                    }, status=status.HTTP_400_BAD_REQUEST)
+        # 재업로드된 같은 이미지는 이전 결과(또는 DALL-E 3 결과)를 재사용하도록 내용 해시 계산
+        # 청크 단위로 읽어 파일 전체를 메모리에 올리지 않음 (큰 업로드는 임시 파일에 있음)
+        hasher = hashlib.sha256()
+        for chunk in image_file.chunks():
+            hasher.update(chunk)
+        image_digest = hasher.hexdigest()
+
+        # 같은 이미지로 이미 아바타를 만든 적이 있으면 GCS 업로드와 외부 API 호출을 모두 생략
+        cached_body = _get_cached_avatar(image_digest)
+        if cached_body:
+            logger.info(f"캐시된 아바타 결과 사용: {cached_body.get('avatar_id')}")
+            return Response(cached_body, status=status.HTTP_200_OK, headers={"X-Cache": "HIT"})
+
+        # 디코딩할 수 없거나 너무 작은 이미지는 외부 API(VisionStory/GPT/DALL-E)를 호출하기 전에 거절
+        quality_error = _check_image_quality(image_file)
+        if quality_error:
+            return Response({
+                "success": False,
+                "error": "이미지 품질 부족",
+                "message": quality_error,
+                "retry_required": True,
+                "suggestion": "더 선명하고 정면을 바라보는 인물 사진을 업로드해주세요."
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # 최종 경로에 한 번만 GCS 업로드 (VisionStory API 호출용, 성공 시 이동 없이 그대로 사용)
+        uploaded_url = upload_file_to_gcs(image_file, folder="avatars")
+        if not uploaded_url:
+            return Response({
+                "success": False,
+                "error": "이미지 업로드 실패",
+                "message": "이미지를 업로드할 수 없습니다.",
+                "retry_required": True
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # async=true 요청 시 Celery 작업으로 넘기고 즉시 202 반환 (워커가 외부 API 응답을 기다리지 않음)
+        if request.data.get("async", "false").lower() == "true":
+            # 작업 ID를 먼저 만들어 조회 토큰과 묶어 둔 뒤 등록 (등록한 요청자만 결과 조회 가능)
+            task_id = str(uuid.uuid4())
+            try:
+                task_token = _register_avatar_task(task_id)
+            except Exception as e:
+                # 토큰을 저장하지 못하면 결과를 조회할 수 없으므로 동기 처리로 대체
+                logger.warning(f"아바타 작업 등록 실패, 동기 처리로 대체: {e}")
             else:
-                # VisionStory API 실패 - DALL-E 3로 새 이미지 생성 시도
-                logger.info(f"VisionStory 아바타 생성 실패 (상태코드: {response.status_code}), DALL-E 3로 새 이미지 생성 시도")
-                logger.info(f"VisionStory 실패 응답: {response.text}")
-                
-                # 원본 이미지로 프롬프트 생성
-                logger.info("GPT-4o로 프롬프트 생성 시작")
-                prompt = _generate_prompt(temp_file_url)
-                if not prompt:
-                    logger.error("GPT-4o 프롬프트 생성 실패")
-                    return Response({
-                        "success": False,
-                        "error": "프롬프트 생성 실패",
-                        "message": "이미지 분석에 실패했습니다. 다른 이미지를 시도해주세요.",
-                        "retry_required": True
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                
-                # DALL-E 3로 새 이미지 생성
-                logger.info("DALL-E 3 이미지 생성 시작")
-                logger.info(f"생성할 프롬프트: {prompt}")
-                dalle_image_url = _generate_dalle_image(prompt)
-                if not dalle_image_url:
-                    logger.error("DALL-E 3 이미지 생성 실패")
-                    return Response({
-                        "success": False,
-                        "error": "DALL-E 3 이미지 생성 실패",
-                        "message": "새 이미지 생성에 실패했습니다. 다른 이미지를 시도해주세요.",
-                        "retry_required": True
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                
-                # 생성된 이미지를 GCS에 업로드
-                logger.info(f"DALL-E 3 생성 이미지 GCS 업로드 시작: {dalle_image_url}")
-                dalle_gcs_url = _upload_image_to_gcs(dalle_image_url)
-                if not dalle_gcs_url:
-                    logger.error("DALL-E 3 생성 이미지 GCS 업로드 실패")
-                    return Response({
-                        "success": False,
-                        "error": "DALL-E 3 이미지 업로드 실패",
-                        "message": "생성된 이미지 업로드에 실패했습니다.",
-                        "retry_required": True
-                    }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-                
-                # DALL-E 3로 생성된 이미지로 VisionStory 다시 시도
-                logger.info("DALL-E 3 생성 이미지로 VisionStory 재시도")
-                retry_response = _call_visionstory_api(dalle_gcs_url)
-                
-                if retry_response and retry_response.status_code == 200:
-                    # 재시도 성공
-                    result = retry_response.json()
-                    avatar_id = result.get("data", {}).get("avatar_id")
-                    
-                    if avatar_id:
-                        logger.info(f"DALL-E 3 이미지로 VisionStory 아바타 생성 성공: {avatar_id}")
-                        
-                        return Response({
-                            "success": True,
-                            "avatar_id": avatar_id,
-                            "thumbnail_url": result.get("data", {}).get("thumbnail_url"),
-                            "uploaded_url": dalle_gcs_url,
-                            "message": "DALL-E 3로 생성된 이미지로 아바타 생성 성공",
-                            "used_dalle": True  # DALL-E 3 사용 여부 표시
-                        }, status=status.HTTP_200_OK)
-                    else:
-                        return Response({
-                            "success": False,
-                            "error": "DALL-E 3 이미지 아바타 생성 실패",
-                            "message": "새 이미지로도 아바타 생성에 실패했습니다. 다른 이미지를 시도해주세요.",
-                            "retry_required": True
-                        }, status=status.HTTP_400_BAD_REQUEST)
-                else:
-                    # DALL-E 3 이미지로도 실패
-                    error_message = "원본 이미지와 새로 생성된 이미지 모두로 아바타 생성에 실패했습니다."
-                    if retry_response:
-                        try:
-                            error_data = retry_response.json()
-                            error_message = error_data.get("message", error_message)
-                        except (json.JSONDecodeError, KeyError) as e:
-                            logger.warning(f"재시도 응답 파싱 실패: {e}")
-                    
-                    return Response({
-                        "success": False,
-                        "error": "VisionStory API 오류 (DALL-E 3 재시도 포함)",
-                        "message": error_message,
-                        "retry_required": True,
-                        "suggestion": "더 선명하고 정면을 바라보는 인물 사진을 업로드해주세요."
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                
-        finally:
-            # 임시 파일 삭제
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+                generate_avatar_task.apply_async(args=(uploaded_url, image_digest), task_id=task_id)
+                logger.info(f"아바타 생성 작업 등록: task_id={task_id}")
+                return Response({
+                    "success": True,
+                    "task_id": task_id,
+                    "task_token": task_token,
+                    "message": "아바타 생성 작업이 등록되었습니다."
+                }, status=status.HTTP_202_ACCEPTED)
+
+        body, status_code = generate_avatar_from_url(uploaded_url, image_digest)
+        return Response(body, status=status_code, headers={"X-Cache": "MISS", **_retry_after_headers(body)})
+
+
+class AvatarTaskStatusView(APIView):
+    """비동기 아바타 생성 작업 상태 조회 API"""
+    authentication_classes = []  # 인증이 필요 없는 엔드포인트 - JWT 검증 생략
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        tags=["avatars"],
+        operation_summary="아바타 생성 작업 상태 조회",
+        operation_description="async=true로 등록한 아바타 생성 작업의 상태를 조회합니다. 완료 시 아바타 생성 API와 같은 응답을 반환합니다.",
+        manual_parameters=[
+            openapi.Parameter(
+                name="X-Task-Token",
+                in_=openapi.IN_HEADER,
+                type=openapi.TYPE_STRING,
+                description="작업 등록 응답의 task_token",
+                required=True
+            )
+        ],
+        responses={
+            200: openapi.Response(description="작업 완료 (아바타 생성 성공)", schema=AVATAR_CREATE_SUCCESS_SCHEMA),
+            202: openapi.Response(
+                description="작업 진행 중",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        'success': openapi.Schema(type=openapi.TYPE_BOOLEAN, example=True),
+                        'task_id': openapi.Schema(type=openapi.TYPE_STRING, description='작업 ID'),
+                        'status': openapi.Schema(type=openapi.TYPE_STRING, description='Celery 작업 상태', example='PENDING'),
+                    }
+                )
+            ),
+            400: openapi.Response(description="작업 완료 (아바타 생성 실패 - 다른 이미지 필요)", schema=AVATAR_CREATE_FAILURE_SCHEMA),
+            404: openapi.Response(description="작업 없음 (등록되지 않았거나 만료된 작업, 토큰 불일치)"),
+            500: openapi.Response(description="서버 오류", schema=AVATAR_SERVER_ERROR_SCHEMA),
+            503: openapi.Response(description="작업 완료 (VisionStory 일시적 사용 불가 - Retry-After(초) 후 재시도)", schema=AVATAR_SERVER_ERROR_SCHEMA)
+        }
+    )
+    def get(self, request, task_id):
+        """아바타 생성 작업 상태 조회"""
+        # 이 API로 등록한 작업만 조회 가능 (임의/만료된 ID는 PENDING 대신 404)
+        if not _is_avatar_task_owner(task_id, request.headers.get("X-Task-Token")):
+            return Response({
+                "success": False,
+                "error": "작업을 찾을 수 없습니다.",
+                "retry_required": True
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        result = AsyncResult(task_id)
+
+        if not result.ready():
+            return Response({
+                "success": True,
+                "task_id": task_id,
+                "status": result.status
+            }, status=status.HTTP_202_ACCEPTED)
+
+        if result.failed():
+            logger.error(f"아바타 생성 작업 실패: task_id={task_id}, error={result.result}")
+            return Response({
+                "success": False,
+                "error": "아바타 생성 작업 실패",
+                "message": "아바타 생성 중 오류가 발생했습니다. 다시 시도해주세요.",
+                "retry_required": True
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        # 다른 Celery 작업의 결과는 (본문, 상태코드) 형태가 아니므로 풀기 전에 작업 이름 확인
+        if result.name != generate_avatar_task.name:
+            logger.error(f"아바타 생성 작업이 아님: task_id={task_id}, name={result.name}")
+            return Response({
+                "success": False,
+                "error": "작업을 찾을 수 없습니다.",
+                "retry_required": True
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        body, status_code = result.result
+        return Response(body, status=status_code, headers=_retry_after_headers(body))
@@ -0,0 +1,105 @@
+import logging
+import threading
+import time
+from typing import Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingRetry(Retry):
+    """재시도할 때마다 원인을 로그로 남기는 urllib3 Retry"""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        reason = response.status if response is not None else error
+        logger.warning(f"HTTP 재시도: {method} {url} ({reason})")
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def create_session(
+    pool_connections: int = 20,
+    pool_maxsize: int = 50,
+    backoff_factor: float = 0.1,
+    status_forcelist: Optional[Iterable[int]] = None,
+    allowed_methods: Optional[Iterable[str]] = None,
+) -> requests.Session:
+    """
+    keep-alive 커넥션 풀을 사용하는 requests.Session 생성
+
+    모듈 단위로 한 번 생성해 재사용하면 요청마다 TCP/TLS 핸드셰이크를 반복하지 않습니다.
+
+    Args:
+        pool_connections: 호스트별 커넥션 풀 개수
+        pool_maxsize: 풀당 최대 커넥션 수
+        backoff_factor: 재시도 간 대기 시간 계수
+        status_forcelist: 재시도할 HTTP 상태코드 (기본적으로 멱등 메서드에만 적용)
+        allowed_methods: 재시도를 허용할 메서드 (POST 등 비멱등 메서드를 포함할 때 지정)
+
+    Returns:
+        requests.Session: HTTPS 어댑터가 마운트된 세션
+    """
+    retry_options = {}
+    if allowed_methods is not None:
+        # 요청 전송 후 응답을 읽다 실패한 경우는 서버가 이미 처리했을 수 있으므로 재전송하지 않음
+        retry_options = {"allowed_methods": frozenset(allowed_methods), "read": 0}
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=LoggingRetry(
+            total=2,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            # 재시도 후에도 실패하면 예외 대신 마지막 응답을 반환 (호출부에서 상태코드로 처리)
+            raise_on_status=False,
+            **retry_options,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 동안 외부 호출을 차단하는 회로 차단기
+
+    장애 중인 외부 API에 매 요청마다 타임아웃까지 기다리지 않도록, fail_max번 연속 실패하면
+    reset_timeout초 동안 호출을 막고 이후 한 번의 시험 호출로 복구 여부를 확인합니다.
+
+    Args:
+        fail_max: 회로를 여는 연속 실패 횟수
+        reset_timeout: 회로를 연 뒤 시험 호출을 허용하기까지의 시간 (초)
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (차단 시간이 지나면 시험 호출 한 번을 허용)"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # 시험 호출 동안 다른 요청은 계속 차단
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
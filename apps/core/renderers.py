@@ -0,0 +1,22 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class OrjsonRenderer(BaseRenderer):
+    """
+    orjson 기반 JSON 렌더러 (DRF JSONRenderer 대체)
+
+    orjson이 직접 처리하지 못하는 타입(Decimal, lazy 번역 문자열 등)은 DRF JSONEncoder로 변환합니다.
+    datetime/date/time도 DRF JSONEncoder 형식(예: 2025-01-01T00:00:00.123Z)을 유지하도록 orjson 기본 직렬화 대신 넘깁니다.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    _encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._encoder.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtworkBasicInfo:
     """작품의 핵심 정보만 담당"""
     title: str = "작품명 확인 불가"
@@ -6,7 +6,7 @@ from apps.core.services.entities.content_fetch_info import ContentFetchInfo
 from apps.core.services.entities.video_script_info import VideoScriptInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtworkExtractedInfo:
     """모든 정보를 통합하는 컨테이너"""
     basic_info: ArtworkBasicInfo
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, List, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentFetchInfo:
     """Fetch MCP 결과만 담당"""
     performed: bool = False
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionMetadata:
     """추출 과정의 메타데이터 담당"""
     confidence: float = 0.0
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoScriptInfo:
     """VisionStory AI용 영상 스크립트 정보"""
     script_content: str = ""  # 완성된 스크립트 내용
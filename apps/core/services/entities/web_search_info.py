@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class WebSearchInfo:
     """웹 검색 관련 정보만 담당"""
     performed: bool = False
@@ -1,10 +1,14 @@
 import os
-import json
 import base64
 import logging
 import traceback
 import asyncio
+import hashlib
+from functools import lru_cache
+import orjson
 from dotenv import load_dotenv
+from django.conf import settings
+from django.core.cache import cache
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 import re
@@ -43,10 +47,19 @@ class BraveSearchError(Exception):
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # 초
 
+# MCP 응답 텍스트에서 URL 추출 (항목별 텍스트용 / 단일 텍스트용 - 괄호로 끝나는 마크다운 링크 제외)
+_URL_RE = re.compile(r'https?://[^\s\"\'<>]+')
+_TEXT_URL_RE = re.compile(r'https?://[^\s\\)\\]\"\']+')
 
+# 같은 작품/박물관 재검색 시 MCP 왕복을 생략하기 위한 검색 결과 캐시 TTL (0이면 비활성화)
+BRAVE_SEARCH_CACHE_TTL = settings.BRAVE_SEARCH_CACHE_TTL
+
+
+@lru_cache(maxsize=1)
 def get_brave_mcp_url():
+    """Brave MCP URL (설정은 프로세스 시작 시 고정되므로 한 번만 생성)"""
     config = {"braveApiKey": BRAVE_API_KEY}
-    config_b64 = base64.b64encode(json.dumps(config).encode()).decode()
+    config_b64 = base64.b64encode(orjson.dumps(config)).decode()
     return (
         f"https://server.smithery.ai/@smithery-ai/brave-search/mcp"
         f"?config={config_b64}&api_key={SMITHERY_API_KEY}&profile={BRAVE_PROFILE}"
@@ -64,12 +77,29 @@ async def brave_search(query, count=3) -> dict:
     Returns:
         Dict: 검색 결과 (URL 리스트 포함)
     """
+    cache_key = _search_cache_key(query, count) if BRAVE_SEARCH_CACHE_TTL else None
+    if cache_key:
+        try:
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                logger.info(f"🔍 Brave Search 캐시 적중: query='{query}'")
+                return cached
+        except Exception as e:
+            logger.warning(f"Brave Search 캐시 조회 실패: {e}")
+
     url = get_brave_mcp_url()
     logger.info(f"🔍 Brave Search 요청: query='{query}', count={count}")
 
     for attempt in range(MAX_RETRIES):
         try:
-            return await _brave_search_single_attempt(url, query, count)
+            result = await _brave_search_single_attempt(url, query, count)
+            # URL을 찾은 결과만 캐시 (빈 결과/오류는 다음 요청에서 다시 검색)
+            if cache_key and result.get("results"):
+                try:
+                    await cache.aset(cache_key, result, BRAVE_SEARCH_CACHE_TTL)
+                except Exception as e:
+                    logger.warning(f"Brave Search 캐시 저장 실패: {e}")
+            return result
         except MCPConnectionError as e:
             if attempt == MAX_RETRIES - 1:
                 logger.error(f"Brave MCP 연결 최종 실패: {e}")
@@ -88,6 +118,12 @@ async def brave_search(query, count=3) -> dict:
     return {"success": False, "error": "최대 재시도 횟수 초과", "results": []}
 
 
+def _search_cache_key(query: str, count: int) -> str:
+    """공백/대소문자를 정규화한 검색어와 결과 개수 기반 캐시 키"""
+    normalized = " ".join(query.split()).lower()
+    return f"brave:{count}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+
+
 async def _brave_search_single_attempt(url: str, query: str, count: int) -> dict:
     """단일 Brave Search MCP 요청 시도"""
     try:
@@ -132,7 +168,7 @@ def _process_brave_result(content, result) -> dict:
             elif hasattr(item, "text"):
                 # text에서 URL 추출
                 text = getattr(item, "text", "")
-                found_urls = re.findall(r'https?://[^\s\"\'<>]+', text)
+                found_urls = _URL_RE.findall(text)
                 urls.extend(found_urls)
                 logger.warning(f"⚠️ meta 없음, text에서 URL 추출: {found_urls}")
             else:
@@ -142,7 +178,7 @@ def _process_brave_result(content, result) -> dict:
 
     # ✅ TextContent 단일 객체 처리 (text에서 URL 추출)
     if hasattr(content, "text"):
-        found_urls = re.findall(r'https?://[^\s\\)\\]\"\']+', getattr(content, "text", ""))
+        found_urls = _TEXT_URL_RE.findall(getattr(content, "text", ""))
         if found_urls:
             logger.info(f"✅ 단일 text에서 URL 추출: {found_urls}")
             return {"success": True, "results": found_urls}
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import vertexai
 from vertexai.generative_models import GenerativeModel, GenerationResponse
@@ -8,6 +9,18 @@ from vertexai.generative_models import GenerativeModel, GenerationResponse
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _init_vertex_ai(project_id: str, location: str) -> None:
+    """프로젝트/리전별 Vertex AI 초기화 (프로세스당 한 번)"""
+    vertexai.init(project=project_id, location=location)
+
+
+@lru_cache(maxsize=4)
+def _get_model(model_name: str) -> GenerativeModel:
+    """모델명별 GenerativeModel 인스턴스 공유 (여러 GeminiService 인스턴스가 같은 모델 재사용)"""
+    return GenerativeModel(model_name)
+
+
 class GeminiService:
     """
     Google Vertex AI Gemini 모델 서비스
@@ -144,10 +157,7 @@ class GeminiService:
     def _initialize_vertex_ai(self):
         """Vertex AI 초기화"""
         try:
-            vertexai.init(
-                project=self.project_id,
-                location=self.location
-            )
+            _init_vertex_ai(self.project_id, self.location)
             logger.info(f"Vertex AI 초기화 완료 - 프로젝트: {self.project_id}, 리전: {self.location}")
         except Exception as e:
             logger.error(f"Vertex AI 초기화 실패: {e}")
@@ -156,7 +166,7 @@ class GeminiService:
     def _load_model(self):
         """Gemini 모델 로드"""
         try:
-            self.model = GenerativeModel(self.model_name)
+            self.model = _get_model(self.model_name)
             logger.info(f"Gemini 모델 로드 완료: {self.model_name}")
         except Exception as e:
             logger.error(f"Gemini 모델 로드 실패: {e}")
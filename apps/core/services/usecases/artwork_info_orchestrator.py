@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from dataclasses import replace
 from typing import Optional, Dict, Any
 from apps.core.services.entities.artwork_extracted_info import ArtworkExtractedInfo
 from apps.core.services.entities.video_script_info import VideoScriptInfo
@@ -57,11 +59,12 @@ class ArtworkInfoOrchestrator:
             
             # 1단계: 기본 정보 추출
             logger.info("1단계: 기본 정보 추출")
-            basic_info, metadata = self.basic_extractor.extract_basic_info(ocr_text)
+            # 동기 Gemini 호출은 스레드에서 실행 (이벤트 루프를 막지 않도록)
+            basic_info, metadata = await asyncio.to_thread(self.basic_extractor.extract_basic_info, ocr_text)
             
             # 2단계: 웹 검색 보강
             logger.info("2단계: 웹 검색 보강")
-            web_search_info = self.web_enricher.enrich_with_web_search(basic_info, museum_name)
+            web_search_info = await self.web_enricher.enrich_with_web_search_async(basic_info, museum_name)
             
             # 3단계: 콘텐츠 Fetch 보강 (웹 검색이 수행된 경우만)
             logger.info("3단계: 콘텐츠 Fetch 보강")
@@ -81,25 +84,18 @@ class ArtworkInfoOrchestrator:
             
             # 4단계: 영상 스크립트 생성
             logger.info("4단계: 영상 스크립트 생성")
-            video_script_info = self.script_generator.generate_video_script(
-                ArtworkExtractedInfo(
-                    basic_info=basic_info,
-                    metadata=metadata,
-                    web_search=web_search_info,
-                    content_fetch=content_fetch_info,
-                    video_script=VideoScriptInfo()  # 임시 객체
-                )
-            )
-            
-            # 5단계: 최종 결과 통합
-            logger.info("5단계: 최종 결과 통합")
-            final_result = ArtworkExtractedInfo(
+            extracted_info = ArtworkExtractedInfo(
                 basic_info=basic_info,
                 metadata=metadata,
                 web_search=web_search_info,
                 content_fetch=content_fetch_info,
-                video_script=video_script_info
+                video_script=VideoScriptInfo()  # 임시 객체
             )
+            video_script_info = await asyncio.to_thread(self.script_generator.generate_video_script, extracted_info)
+            
+            # 5단계: 최종 결과 통합 (스크립트만 교체)
+            logger.info("5단계: 최종 결과 통합")
+            final_result = replace(extracted_info, video_script=video_script_info)
             
             self.stats["successful_extractions"] += 1
             logger.info("=== 작품 정보 추출 및 보강 완료 ===")
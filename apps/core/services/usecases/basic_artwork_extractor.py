@@ -1,14 +1,126 @@
+import hashlib
 import json
 import logging
 import re
+import threading
+from concurrent.futures import Future
+from dataclasses import replace
 from datetime import datetime
 from typing import Optional, Dict
+import orjson
+from django.conf import settings
+from django.core.cache import cache
 from apps.core.services.entities.artwork_basic_info import ArtworkBasicInfo
 from apps.core.services.entities.extraction_metadata import ExtractionMetadata
 from apps.core.services.externals.gemini_service import GEMINI_SERVICE
 
 logger = logging.getLogger(__name__)
 
+# 같은 설명판 재촬영 시 Gemini 호출을 생략하기 위한 추출 결과 캐시 TTL (0이면 비활성화)
+ARTWORK_EXTRACTION_CACHE_TTL = settings.ARTWORK_EXTRACTION_CACHE_TTL
+
+# Gemini 원본 응답 일부는 디버깅용으로만 메타데이터에 보관 (운영에서는 캐시/직렬화 크기 절약)
+STORE_RAW_RESPONSE = settings.DEBUG
+
+# Gemini 응답의 ```json ... ``` 코드 블록(없으면 앞뒤 설명 문장을 제외한 첫 {부터 마지막 }까지)에서 JSON 객체만 추출
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# Gemini가 값 대신 돌려주는 "없음" 표현 (소문자 기준 비교)
+_NULL_VALUES = frozenset({"null", "없음", "미상", "불명"})
+
+# fallback 규칙 추출용 연도 패턴 (예: 1889년, 1503-1519, 16세기)
+_YEAR_RE = re.compile(r'\b(\d{4}(?:-\d{4})?년?|\d{1,2}세기)\b')
+
+# 문장 부호가 있는 첫 줄은 작품명이 아닌 문장으로 간주
+_SENTENCE_PUNCT_RE = re.compile(r'[.!?]')
+
+# 설명 문장으로 간주할 한국어 서술 어미
+_SENTENCE_ENDINGS = ('다.', '이다', '된다')
+
+# 무의미한 작품명 (소문자 기준 비교)
+_INVALID_TITLES = frozenset({
+    "정보 없음", "정보없음", "불명", "미상", "제목없음", "무제",
+    "???", "---", "unknown", "없음", "확인불가", "불분명"
+})
+
+# 작품 정보 추출 프롬프트의 고정 지시문 (OCR 텍스트를 맨 뒤에 붙여 요청 간 동일한 앞부분이 Gemini 프롬프트 캐시에 적중하도록 함)
+_EXTRACTION_PROMPT_PREFIX = """맨 아래는 박물관이나 미술관에서 촬영한 작품 설명판의 OCR 텍스트입니다. 
+OCR로 인식된 텍스트는 어색하거나 오타가 있을 수 있으므로, 자연스럽고 정확한 한국어로 다듬어서 작품 정보를 추출해주세요.
+
+추출 및 다듬기 요구사항:
+1. 작품명 (title): 작품의 제목을 자연스럽게 다듬기
+   - OCR 오타 수정 (예: "모나리자" → "모나리자")
+   - 불필요한 기호나 공백 제거
+   - 작품명이 명확하지 않으면 "정보 없음"
+
+2. 작가명 (artist): 작가의 이름을 정확하게 다듬기
+   - 외국 작가명은 한국어 표기법으로 통일 (예: "Leonardo da Vinci" → "레오나르도 다 빈치")
+   - 작가명 오타 수정
+   - 작가 정보가 없으면 "정보 없음"
+
+3. 제작연도 (year): 연도를 명확하게 정리
+   - "1889년", "1503-1519", "16세기" 등 원본 형태 유지
+   - 연도 범위는 그대로 유지
+   - 연도 정보가 없으면 "정보 없음"
+
+4. 작품설명 (description): 설명을 자연스럽고 읽기 쉽게 다듬기
+   - OCR 오타 수정 및 문장 부호 정리
+   - 어색한 표현을 자연스럽게 수정
+   - 문장 구조를 명확하게 정리
+   - 설명이 없으면 "정보 없음"
+
+다듬기 규칙:
+- OCR 오타를 정확한 한국어로 수정
+- 불필요한 공백, 기호, 특수문자 제거
+- 문장을 자연스럽고 읽기 쉽게 정리
+- 작품 정보의 의미는 그대로 유지
+- 추측하지 말고 텍스트에 명시된 내용만 다듬기
+
+응답은 반드시 아래 JSON 형식으로만 답변하세요:
+
+{
+  "title": "다듬어진 작품명 또는 정보 없음",
+  "artist": "다듬어진 작가명 또는 정보 없음",
+  "year": "정리된 제작연도 또는 정보 없음", 
+  "description": "다듬어진 작품 설명 또는 정보 없음"
+}
+
+OCR 텍스트:
+"""
+
+# 프롬프트에 넣을 OCR 텍스트 최대 길이 (전시 벽면 전체를 찍은 경우 등 입력 토큰 상한)
+MAX_PROMPT_OCR_CHARS = 4000
+
+# JSON만 생성하도록 요청 (코드 블록/설명 문장 없이 닫는 중괄호에서 생성이 끝나 꼬리 토큰 대기가 없음)
+_EXTRACTION_GENERATION_CONFIG = {"response_mime_type": "application/json"}
+
+# 같은 OCR 텍스트로 진행 중인 추출 (캐시 저장 전 동시 요청이 Gemini를 중복 호출하지 않도록 공유)
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _singleflight(key: str, fn):
+    """같은 키로 동시에 들어온 호출은 먼저 시작한 호출의 결과(또는 예외)를 함께 받음"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+    
+    if not is_leader:
+        logger.info("같은 OCR 텍스트의 추출이 진행 중 - 결과 대기")
+        return future.result()
+    
+    try:
+        future.set_result(fn())
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    return future.result()
+
+
 class ArtworkTitleNotFoundError(Exception):
     """작품명을 찾을 수 없을 때 발생하는 예외"""
     pass
@@ -47,12 +159,25 @@ class BasicArtworkExtractor:
         if not ocr_text or not ocr_text.strip():
             raise ArtworkTitleNotFoundError("빈 OCR 텍스트로 작품명을 확인할 수 없습니다")
         
+        cache_key = self._cache_key(ocr_text)
+        if ARTWORK_EXTRACTION_CACHE_TTL:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info("작품 정보 캐시 적중 - Gemini 호출 생략")
+                basic_info, metadata = cached
+                # 호출자가 캐시 결과임을 알 수 있도록 추출 방식/시각만 바꾼 사본 반환
+                return basic_info, replace(metadata, extraction_method="cache_hit", extraction_timestamp=datetime.now())
+        
+        return _singleflight(cache_key, lambda: self._extract_uncached(ocr_text, cache_key))
+    
+    def _extract_uncached(self, ocr_text: str, cache_key: str) -> tuple[ArtworkBasicInfo, ExtractionMetadata]:
+        """Gemini 호출로 기본 작품 정보 추출 (실패 시 규칙 기반 fallback)"""
         try:
             # Gemini AI 프롬프트 구성
             prompt = self._build_extraction_prompt(ocr_text)
             
             # Gemini API 호출
-            raw_response = self.gemini_service.generate_content(prompt)
+            raw_response = self.gemini_service.generate_content(prompt, generation_config=_EXTRACTION_GENERATION_CONFIG)
             
             if raw_response:
                 # JSON 파싱 및 정보 추출
@@ -60,25 +185,26 @@ class BasicArtworkExtractor:
                 
                 if extracted_data:
                     basic_info = ArtworkBasicInfo(
-                        title=extracted_data.get("title", self.default_values["title"]),
-                        artist=extracted_data.get("artist", self.default_values["artist"]),
-                        year=extracted_data.get("year", self.default_values["year"]),
-                        description=extracted_data.get("description", self.default_values["description"])
+                        title=extracted_data["title"],
+                        artist=extracted_data["artist"],
+                        year=extracted_data["year"],
+                        description=extracted_data["description"]
                     )
                     
                     metadata = ExtractionMetadata(
                         confidence=0.9,
                         extraction_method="gemini_ai_success",
-                        raw_response=raw_response[:200],  # 처음 200자만 저장
+                        raw_response=raw_response[:200] if STORE_RAW_RESPONSE else "",  # DEBUG에서만 처음 200자 저장
                         success=True,
                         extraction_timestamp=datetime.now()
                     )
                     
                     # 작품명 검증
-                    if self._is_invalid_title(basic_info.title):
-                        raise ArtworkTitleNotFoundError(
-                            f"작품명을 확인할 수 없어 저장할 수 없습니다. OCR 텍스트: {ocr_text[:50]}..."
-                        )
+                    self._require_valid_title(basic_info.title, ocr_text)
+                    
+                    # Gemini 추출에 성공한 결과만 캐시 (fallback 결과는 저장하지 않음)
+                    if ARTWORK_EXTRACTION_CACHE_TTL:
+                        self._cache_result(cache_key, (basic_info, metadata))
                     
                     return basic_info, metadata
             
@@ -86,10 +212,7 @@ class BasicArtworkExtractor:
             basic_info, metadata = self._create_fallback_result(ocr_text, "gemini_response_failed")
             
             # fallback도 작품명 검증
-            if self._is_invalid_title(basic_info.title):
-                raise ArtworkTitleNotFoundError(
-                    f"작품명을 확인할 수 없어 저장할 수 없습니다. OCR 텍스트: {ocr_text[:50]}..."
-                )
+            self._require_valid_title(basic_info.title, ocr_text)
             
             return basic_info, metadata
             
@@ -103,90 +226,55 @@ class BasicArtworkExtractor:
             basic_info, metadata = self._create_fallback_result(ocr_text, f"gemini_error: {str(e)[:50]}")
             
             # fallback도 작품명 없으면 에러
-            if self._is_invalid_title(basic_info.title):
-                raise ArtworkTitleNotFoundError(
-                    f"작품명을 확인할 수 없어 저장할 수 없습니다. OCR 텍스트: {ocr_text[:50]}..."
-                )
+            self._require_valid_title(basic_info.title, ocr_text)
             
             return basic_info, metadata
     
+    def _cache_key(self, ocr_text: str) -> str:
+        """공백/대소문자를 정규화한 OCR 텍스트의 sha256 기반 캐시 키"""
+        normalized = " ".join(ocr_text.split()).lower()
+        return f"artwork:{hashlib.sha256(normalized.encode()).hexdigest()}"
+    
+    def _get_cached_result(self, cache_key: str) -> Optional[tuple[ArtworkBasicInfo, ExtractionMetadata]]:
+        """캐시된 추출 결과 조회 (캐시 장애 시 None)"""
+        try:
+            return cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"작품 정보 캐시 조회 실패: {e}")
+            return None
+    
+    def _cache_result(self, cache_key: str, result: tuple[ArtworkBasicInfo, ExtractionMetadata]):
+        """추출 결과 저장 (캐시 장애는 무시)"""
+        try:
+            cache.set(cache_key, result, ARTWORK_EXTRACTION_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"작품 정보 캐시 저장 실패: {e}")
+    
     def _build_extraction_prompt(self, ocr_text: str) -> str:
-        """Gemini용 작품 정보 추출 및 다듬기 프롬프트 구성"""
-        
-        return f"""다음은 박물관이나 미술관에서 촬영한 작품 설명판의 OCR 텍스트입니다. 
-OCR로 인식된 텍스트는 어색하거나 오타가 있을 수 있으므로, 자연스럽고 정확한 한국어로 다듬어서 작품 정보를 추출해주세요.
-
-OCR 텍스트:
-\"\"\"
-{ocr_text}
-\"\"\"
-
-추출 및 다듬기 요구사항:
-1. 작품명 (title): 작품의 제목을 자연스럽게 다듬기
-   - OCR 오타 수정 (예: "모나리자" → "모나리자")
-   - 불필요한 기호나 공백 제거
-   - 작품명이 명확하지 않으면 "정보 없음"
-
-2. 작가명 (artist): 작가의 이름을 정확하게 다듬기
-   - 외국 작가명은 한국어 표기법으로 통일 (예: "Leonardo da Vinci" → "레오나르도 다 빈치")
-   - 작가명 오타 수정
-   - 작가 정보가 없으면 "정보 없음"
-
-3. 제작연도 (year): 연도를 명확하게 정리
-   - "1889년", "1503-1519", "16세기" 등 원본 형태 유지
-   - 연도 범위는 그대로 유지
-   - 연도 정보가 없으면 "정보 없음"
-
-4. 작품설명 (description): 설명을 자연스럽고 읽기 쉽게 다듬기
-   - OCR 오타 수정 및 문장 부호 정리
-   - 어색한 표현을 자연스럽게 수정
-   - 문장 구조를 명확하게 정리
-   - 설명이 없으면 "정보 없음"
-
-다듬기 규칙:
-- OCR 오타를 정확한 한국어로 수정
-- 불필요한 공백, 기호, 특수문자 제거
-- 문장을 자연스럽고 읽기 쉽게 정리
-- 작품 정보의 의미는 그대로 유지
-- 추측하지 말고 텍스트에 명시된 내용만 다듬기
-
-응답은 반드시 아래 JSON 형식으로만 답변하세요:
-
-{{
-  "title": "다듬어진 작품명 또는 정보 없음",
-  "artist": "다듬어진 작가명 또는 정보 없음",
-  "year": "정리된 제작연도 또는 정보 없음", 
-  "description": "다듬어진 작품 설명 또는 정보 없음"
-}}"""
+        """Gemini용 작품 정보 추출 및 다듬기 프롬프트 구성 (고정 지시문 + OCR 텍스트)"""
+        if len(ocr_text) > MAX_PROMPT_OCR_CHARS:
+            ocr_text = ocr_text[:MAX_PROMPT_OCR_CHARS] + "\n...(이하 생략)"
+        return f'{_EXTRACTION_PROMPT_PREFIX}"""\n{ocr_text}\n"""'
     
     def _parse_gemini_response(self, response_text: str) -> Optional[Dict[str, str]]:
         """Gemini 응답을 JSON으로 파싱"""
         try:
-            # JSON 부분만 추출
-            if '```json' in response_text:
-                start = response_text.find('```json') + 7
-                end = response_text.find('```', start)
-                json_text = response_text[start:end].strip()
-            elif '```' in response_text:
-                start = response_text.find('```') + 3
-                end = response_text.find('```', start)
-                json_text = response_text[start:end].strip()
-            else:
-                # JSON 블록 없이 바로 JSON인 경우
-                json_text = response_text.strip()
+            # JSON 부분만 추출 (JSON 객체가 보이지 않으면 응답 전체를 JSON으로 간주)
+            match = _JSON_BLOCK_RE.search(response_text)
+            json_text = (match.group(1) or match.group(2)) if match else response_text.strip()
             
             # JSON 파싱
-            result = json.loads(json_text)
+            result = orjson.loads(json_text)
             
-            # 필수 필드 확인 및 기본값 적용
-            for field in ["title", "artist", "year", "description"]:
-                if field not in result or not result[field] or result[field].strip() == "":
-                    result[field] = self.default_values[field]
-                elif result[field].strip().lower() in ["null", "없음", "미상", "불명"]:
-                    result[field] = self.default_values[field]
-                else:
-                    # 문자열 정리
-                    result[field] = result[field].strip()
+            # 필수 필드 확인 및 기본값 적용 (필드당 조회/정리 한 번, 숫자 연도는 문자열로 변환)
+            for field, default in self.default_values.items():
+                value = result.get(field)
+                if isinstance(value, int):
+                    value = str(value)
+                value = value.strip() if isinstance(value, str) else ""
+                if not value or value.lower() in _NULL_VALUES:
+                    value = default
+                result[field] = value
             
             return result
             
@@ -200,32 +288,37 @@ OCR 텍스트:
     def _create_fallback_result(self, ocr_text: str, error_reason: str) -> tuple[ArtworkBasicInfo, ExtractionMetadata]:
         """AI 실패시 fallback 결과 생성"""
         
-        # 간단한 규칙 기반 정보 추출 시도
-        lines = [line.strip() for line in ocr_text.split('\n') if line.strip()]
-        
         fallback_title = self.default_values["title"]
         fallback_artist = self.default_values["artist"] 
         fallback_year = self.default_values["year"]
         fallback_description = self.default_values["description"]
         
-        # 첫 번째 줄을 작품명으로 추정
-        if lines:
-            first_line = lines[0]
-            if len(first_line) <= 50 and not any(char in first_line for char in '.!?'):
-                fallback_title = first_line
-        
-        # 연도 패턴 찾기
-        year_pattern = r'\b(\d{4}(?:-\d{4})?년?|\d{1,2}세기)\b'
-        for line in lines:
-            year_match = re.search(year_pattern, line)
-            if year_match:
-                fallback_year = year_match.group(0)
-                break
-        
-        # 긴 텍스트를 설명으로 추정
-        for line in lines:
-            if len(line) > 30 and ('다.' in line or '이다' in line or '된다' in line):
+        # 간단한 규칙 기반 정보 추출 시도 - 줄 목록을 만들지 않고 한 번만 순회하며, 연도/설명을 모두 찾으면 중단
+        # (다국어 설명판 등에서 반복되는 줄은 한 번만 검사)
+        seen_lines = set()
+        is_first_line = True
+        year_found = description_found = False
+        for raw_line in ocr_text.splitlines():
+            line = raw_line.strip()
+            if not line or line in seen_lines:
+                continue
+            seen_lines.add(line)
+            
+            # 첫 번째 줄을 작품명으로 추정
+            if is_first_line:
+                is_first_line = False
+                if len(line) <= 50 and not _SENTENCE_PUNCT_RE.search(line):
+                    fallback_title = line
+            
+            if not year_found:
+                year_match = _YEAR_RE.search(line)
+                if year_match:
+                    fallback_year = year_match.group(0)
+                    year_found = True
+            if not description_found and len(line) > 30 and any(ending in line for ending in _SENTENCE_ENDINGS):
                 fallback_description = line
+                description_found = True
+            if year_found and description_found:
                 break
         
         basic_info = ArtworkBasicInfo(
@@ -244,9 +337,17 @@ OCR 텍스트:
         
         return basic_info, metadata
     
+    def _require_valid_title(self, title: str, ocr_text: str) -> None:
+        """작품명이 유효하지 않으면 ArtworkTitleNotFoundError 발생"""
+        if self._is_invalid_title(title):
+            raise ArtworkTitleNotFoundError(
+                f"작품명을 확인할 수 없어 저장할 수 없습니다. OCR 텍스트: {ocr_text[:50]}..."
+            )
+    
     def _is_invalid_title(self, title: str) -> bool:
         """작품명이 유효하지 않은지 검사"""
-        if not title or not title.strip():
+        stripped = title.strip() if title else ""
+        if not stripped:
             return True
         
         # 기본값들
@@ -254,20 +355,15 @@ OCR 텍스트:
             return True
         
         # 무의미한 제목들
-        invalid_titles = [
-            "정보 없음", "정보없음", "불명", "미상", "제목없음", "무제", 
-            "???", "---", "unknown", "없음", "확인불가", "불분명"
-        ]
-        
-        if title.strip().lower() in [t.lower() for t in invalid_titles]:
+        if stripped.lower() in _INVALID_TITLES:
             return True
         
         # 너무 짧은 제목 (2글자 미만)
-        if len(title.strip()) < 2:
+        if len(stripped) < 2:
             return True
         
         # 숫자만 있는 경우
-        if title.strip().isdigit():
+        if stripped.isdigit():
             return True
         
         return False 
\ No newline at end of file
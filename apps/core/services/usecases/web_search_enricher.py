@@ -5,7 +5,7 @@ from typing import Optional
 from apps.core.services.entities.artwork_basic_info import ArtworkBasicInfo
 from apps.core.services.entities.web_search_info import WebSearchInfo
 from apps.core.services.externals.brave_service import brave_search
-from apps.core.services.externals.gemini_service import GeminiService
+from apps.core.services.externals.gemini_service import GeminiService, GEMINI_SERVICE
 from apps.core.services.externals.fetch_service import FetchService
 
 logger = logging.getLogger(__name__)
@@ -58,10 +58,15 @@ class WebSearchEnricher:
     
     def __init__(self, brave_service=None, gemini_service: Optional[GeminiService] = None, fetch_service: Optional[FetchService] = None):
         self.brave_service = brave_service or brave_search
-        self.gemini_service = gemini_service or GeminiService()
+        self.gemini_service = gemini_service or GEMINI_SERVICE
         self.fetch_service = fetch_service or FetchService()
 
     def enrich_with_web_search(self, basic_info: ArtworkBasicInfo, museum_name: Optional[str]) -> WebSearchInfo:
+        """웹 검색 보강 (동기 호출용, event loop 안에서는 enrich_with_web_search_async 사용)"""
+        return _run_async_safely(self.enrich_with_web_search_async(basic_info, museum_name))
+
+    async def enrich_with_web_search_async(self, basic_info: ArtworkBasicInfo, museum_name: Optional[str]) -> WebSearchInfo:
+        """웹 검색 보강 (이미 실행 중인 event loop에서 MCP 호출을 직접 await, 동기 Gemini 호출은 스레드에서 실행)"""
         if not self.brave_service:
             logger.info("Brave Search 서비스를 사용할 수 없습니다")
             return WebSearchInfo(
@@ -81,7 +86,7 @@ class WebSearchEnricher:
                 f"---\n{basic_info.description}\n---\n"
                 "보정된 설명만 출력하세요."
             )
-            gemini_description = self.gemini_service.generate_content(prompt)
+            gemini_description = await asyncio.to_thread(self.gemini_service.generate_content, prompt)
             enriched_description = gemini_description or basic_info.description
             return WebSearchInfo(
                 performed=False,
@@ -98,7 +103,7 @@ class WebSearchEnricher:
         logger.info(f"📣 최종 검색 쿼리: '{query}'")
 
         try:
-            search_results = _run_async_safely(self.brave_service(query, count=5))
+            search_results = await self.brave_service(query, count=5)
             logger.info(f"웹 검색 완료: {search_results}")
             
             urls = []
@@ -112,7 +117,7 @@ class WebSearchEnricher:
             if urls:
                 logger.info(f"URL 추출 완료: {len(urls)}개")
                 try:
-                    fetch_results = _run_async_safely(self.fetch_service.fetch_urls(urls, max_concurrent=3, timeout=30))
+                    fetch_results = await self.fetch_service.fetch_urls(urls, max_concurrent=3, timeout=30)
                     all_contents = [r["content"] for r in fetch_results if r.get("success") and r.get("content")]
                     if all_contents:
                         logger.info(f"콘텐츠 추출 완료: {len(all_contents)}개")
@@ -123,17 +128,17 @@ class WebSearchEnricher:
                         for i, content in enumerate(all_contents, 1):
                             prompt += f"[자료 {i}]\n{content[:1000]}\n\n"
                         logger.info("Gemini로 설명 생성 시작")
-                        gemini_description = self.gemini_service.generate_content(prompt)
+                        gemini_description = await asyncio.to_thread(self.gemini_service.generate_content, prompt)
                         enriched_description = gemini_description or "정보를 찾을 수 없습니다."
                         logger.info(f"설명 생성 완료: {enriched_description[:100]}...")
                     else:
                         # Fetch 실패 시 Brave Search 스니펫만으로 설명 생성
-                        enriched_description = self._create_description_from_search_snippets(search_results, basic_info.title)
+                        enriched_description = await asyncio.to_thread(self._create_description_from_search_snippets, search_results, basic_info.title)
                         logger.info("Fetch 실패로 Brave Search 스니펫만 사용")
                 except Exception as fetch_error:
                     logger.warning(f"Fetch MCP 서비스 오류: {fetch_error}")
                     # Fetch 실패 시 Brave Search 스니펫만으로 설명 생성
-                    enriched_description = self._create_description_from_search_snippets(search_results, basic_info.title)
+                    enriched_description = await asyncio.to_thread(self._create_description_from_search_snippets, search_results, basic_info.title)
                     logger.info("Fetch MCP 실패로 Brave Search 스니펫만 사용")
                     
                 return WebSearchInfo(
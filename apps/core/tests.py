@@ -0,0 +1,96 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from .http import CircuitBreaker
+from .services.usecases.basic_artwork_extractor import BasicArtworkExtractor
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    """연속 실패 시 차단, reset_timeout 후 시험 호출 1회 허용, 성공 시 복구되는지 확인"""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("apps.core.http.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(fail_max=3, reset_timeout=30)
+
+    def _trip(self):
+        for _ in range(self.breaker.fail_max):
+            self.breaker.record_failure()
+
+    def test_closed_until_fail_max_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+
+    def test_success_resets_failure_count(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.allow())
+
+    def test_half_open_allows_single_trial_after_reset_timeout(self):
+        self._trip()
+        self.now += 29
+        self.assertFalse(self.breaker.allow())
+
+        self.now += 1
+        self.assertTrue(self.breaker.allow())
+        # 시험 호출이 끝나기 전 다른 요청은 계속 차단
+        self.assertFalse(self.breaker.allow())
+
+    def test_successful_trial_closes_circuit(self):
+        self._trip()
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_success()
+
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_trial_reopens_circuit(self):
+        self._trip()
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+
+        self.assertFalse(self.breaker.allow())
+        self.now += 30
+        self.assertTrue(self.breaker.allow())
+
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BasicArtworkExtractorCacheTest(SimpleTestCase):
+    """같은 OCR 텍스트 재요청 시 Gemini를 다시 호출하지 않고 캐시 적중으로 표시되는지 확인"""
+
+    OCR_TEXT = "별이 빛나는 밤\n빈센트 반 고흐\n1889년\n캔버스에 유채"
+    GEMINI_RESPONSE = '{"title": "별이 빛나는 밤", "artist": "빈센트 반 고흐", "year": "1889", "description": "캔버스에 유채"}'
+
+    def setUp(self):
+        cache.clear()
+        self.gemini_service = mock.Mock()
+        self.gemini_service.generate_content.return_value = self.GEMINI_RESPONSE
+        self.extractor = BasicArtworkExtractor(gemini_service=self.gemini_service)
+
+    def test_second_call_skips_gemini_and_marks_cache_hit(self):
+        first_info, first_metadata = self.extractor.extract_basic_info(self.OCR_TEXT)
+        second_info, second_metadata = self.extractor.extract_basic_info(self.OCR_TEXT)
+
+        self.gemini_service.generate_content.assert_called_once()
+        self.assertEqual(second_info, first_info)
+        self.assertEqual(first_metadata.extraction_method, "gemini_ai_success")
+        self.assertEqual(second_metadata.extraction_method, "cache_hit")
+        self.assertGreaterEqual(second_metadata.extraction_timestamp, first_metadata.extraction_timestamp)
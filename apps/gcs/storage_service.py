@@ -3,10 +3,18 @@ import requests
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from typing import Optional
+from urllib.parse import unquote, urlparse
 import logging
+from apps.core.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# 외부 이미지(DALL·E 등) 다운로드용 keep-alive 세션
+_download_session = create_session(pool_connections=8, pool_maxsize=16)
+
+# GCS 재개 가능 업로드 청크 크기 (256KB 배수)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class GCSStorageService:
     """Google Cloud Storage 업로드 및 관리 서비스"""
@@ -14,7 +22,7 @@ class GCSStorageService:
     @staticmethod
     def upload_file_from_url(image_url: str, folder: str = "uploads") -> Optional[str]:
         """
-        URL에서 이미지를 다운로드하여 GCS에 업로드
+        URL에서 이미지를 다운로드하면서 GCS에 스트리밍 업로드
         
         Args:
             image_url (str): 업로드할 이미지 URL
@@ -24,18 +32,25 @@ class GCSStorageService:
             Optional[str]: 업로드된 GCS URL 또는 None (실패 시)
         """
         try:
-            # 이미지 다운로드
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            image_content = response.content
-            
             # 고유 파일명 생성
             file_extension = GCSStorageService._get_file_extension(image_url)
             filename = f"{folder}/{uuid.uuid4().hex}{file_extension}"
             
-            # GCS에 업로드
-            gcs_path = default_storage.save(filename, ContentFile(image_content))
-            gcs_url = default_storage.url(gcs_path)
+            # 다운로드 스트림을 그대로 GCS 업로드에 연결 (전체 내용을 메모리에 올리지 않음)
+            with _download_session.get(image_url, stream=True, timeout=(3.05, 30)) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                # 압축 전송된 경우 Content-Length가 실제 크기와 다르므로 사용하지 않음
+                content_length = None if "Content-Encoding" in response.headers else response.headers.get("Content-Length")
+                
+                blob = default_storage.bucket.blob(default_storage._normalize_name(filename))
+                blob.chunk_size = UPLOAD_CHUNK_SIZE
+                blob.upload_from_file(
+                    response.raw,
+                    size=int(content_length) if content_length else None,
+                    content_type=response.headers.get("Content-Type"),
+                )
+            gcs_url = default_storage.url(filename)
             
             logger.info(f"GCS 업로드 성공: {gcs_url}")
             return gcs_url
@@ -103,6 +118,25 @@ class GCSStorageService:
             logger.error(f"GCS 업로드 실패: {e}")
             return None
     
+    @staticmethod
+    def _storage_name_from_url(source_url: str) -> str:
+        """
+        GCS 공개 URL을 default_storage에서 쓰는 객체 이름으로 변환
+        
+        URL 경로는 "/<bucket>/<folder>/<filename>" 형태이므로 앞의 버킷 세그먼트를 제거한다.
+        
+        Args:
+            source_url (str): GCS 파일 URL
+            
+        Returns:
+            str: 버킷 기준 객체 이름 (예: "avatars/filename.jpg")
+        """
+        file_path = unquote(urlparse(source_url).path).lstrip('/')
+        bucket_name = getattr(default_storage, 'bucket_name', None)
+        if bucket_name and file_path.startswith(f"{bucket_name}/"):
+            file_path = file_path[len(bucket_name) + 1:]
+        return file_path
+    
     @staticmethod
     def _process_file(source_url: str, source_folder: str, target_folder: str, delete_source: bool = False) -> Optional[str]:
         """
@@ -118,21 +152,18 @@ class GCSStorageService:
             Optional[str]: 처리된 파일의 새 URL 또는 None (실패 시)
         """
         try:
-            # URL에서 파일 경로 추출
-            from urllib.parse import urlparse
-            parsed_url = urlparse(source_url)
-            file_path = parsed_url.path.lstrip('/')
+            # URL에서 스토리지 객체 이름 추출 (버킷 세그먼트 제외)
+            # 예: https://storage.googleapis.com/teama-buck/temp_avatars/filename.jpg
+            #     -> temp_avatars/filename.jpg
+            file_path = GCSStorageService._storage_name_from_url(source_url)
             
-            # GCS URL 구조: bucket-name/folder/filename
-            # 예: teama-buck/temp_avatars/filename.jpg
             path_parts = file_path.split('/')
-            if len(path_parts) < 3:
+            if len(path_parts) < 2:
                 logger.error(f"잘못된 GCS URL 구조: {file_path}")
                 return None
             
-            bucket_name = path_parts[0]  # teama-buck
-            actual_folder = path_parts[1]  # temp_avatars
-            filename = '/'.join(path_parts[2:])  # filename.jpg
+            actual_folder = path_parts[0]  # temp_avatars
+            filename = '/'.join(path_parts[1:])  # filename.jpg
             
             # 원본 폴더가 경로에 포함되어 있는지 확인
             if actual_folder != source_folder:
@@ -140,39 +171,60 @@ class GCSStorageService:
                 return None
             
             # 대상 경로 생성
-            target_path = f"{bucket_name}/{target_folder}/{filename}"
+            target_path = f"{target_folder}/{filename}"
             
-            # 파일 복사
-            if default_storage.exists(file_path):
-                with default_storage.open(file_path, 'rb') as source_file:
-                    target_gcs_path = default_storage.save(target_path, source_file)
-                    target_url = default_storage.url(target_gcs_path)
-                
-                if delete_source:
-                    try:
-                        default_storage.delete(file_path)
-                        logger.info(f"GCS 파일 이동 성공: {file_path} -> {target_path}")
-                    except Exception as e:
-                        logger.error(f"원본 파일 삭제 실패: {e}")
-                        # 롤백 시도
-                        try:
-                            default_storage.delete(target_gcs_path)
-                        except Exception:
-                            pass
-                        raise
-                else:
-                    logger.info(f"GCS 파일 복사 성공: {file_path} -> {target_path}")
-                
-                return target_url
-            else:
+            # 서버 측 복사 (워커로 내려받아 다시 올리지 않고 GCS 내부에서 복사)
+            bucket = default_storage.bucket
+            source_blob = bucket.get_blob(default_storage._normalize_name(file_path))
+            if source_blob is None:
                 logger.error(f"원본 파일이 존재하지 않음: {file_path}")
                 return None
+            
+            target_blob = bucket.copy_blob(source_blob, bucket, new_name=default_storage._normalize_name(target_path))
+            target_url = default_storage.url(target_path)
+            
+            if delete_source:
+                try:
+                    source_blob.delete()
+                    logger.info(f"GCS 파일 이동 성공: {file_path} -> {target_path}")
+                except Exception as e:
+                    logger.error(f"원본 파일 삭제 실패: {e}")
+                    # 롤백 시도
+                    try:
+                        target_blob.delete()
+                    except Exception:
+                        pass
+                    raise
+            else:
+                logger.info(f"GCS 파일 복사 성공: {file_path} -> {target_path}")
+            
+            return target_url
                 
         except Exception as e:
             operation = "이동" if delete_source else "복사"
             logger.error(f"GCS 파일 {operation} 실패: {e}")
             return None
     
+    @staticmethod
+    def delete_file(source_url: str) -> bool:
+        """
+        GCS 파일 삭제
+        
+        Args:
+            source_url (str): 삭제할 파일 URL
+            
+        Returns:
+            bool: 삭제 성공 여부
+        """
+        try:
+            file_path = GCSStorageService._storage_name_from_url(source_url)
+            default_storage.delete(file_path)
+            logger.info(f"GCS 파일 삭제 성공: {file_path}")
+            return True
+        except Exception as e:
+            logger.error(f"GCS 파일 삭제 실패: {e}")
+            return False
+    
     @staticmethod
     def move_file(source_url: str, source_folder: str, target_folder: str) -> Optional[str]:
         """
@@ -225,6 +277,11 @@ def upload_image_to_gcs(image_url: str, folder: str = "avatars") -> Optional[str
     return GCSStorageService.upload_file_from_url(image_url, folder)
 
 
+def upload_content_to_gcs(file_content: bytes, filename: str, folder: str = "uploads") -> Optional[str]:
+    """파일 내용(bytes)을 GCS에 업로드"""
+    return GCSStorageService.upload_file_from_content(file_content, filename, folder)
+
+
 def upload_file_to_gcs(file_obj, folder: str = "uploads") -> Optional[str]:
     """Django 파일을 GCS에 업로드"""
     return GCSStorageService.upload_django_file(file_obj, folder)
@@ -240,6 +297,11 @@ def move_gcs_file(source_url: str, source_folder: str, target_folder: str) -> Op
     return GCSStorageService.move_file(source_url, source_folder, target_folder)
 
 
+def delete_gcs_file(source_url: str) -> bool:
+    """GCS 파일 삭제"""
+    return GCSStorageService.delete_file(source_url)
+
+
 def copy_gcs_file(source_url: str, source_folder: str, target_folder: str) -> Optional[str]:
     """GCS 내에서 파일을 한 폴더에서 다른 폴더로 복사"""
     return GCSStorageService.copy_file(source_url, source_folder, target_folder) 
\ No newline at end of file
@@ -5,6 +5,8 @@ import base64
 import json
 import logging
 import math
+from functools import lru_cache
+import orjson
 from typing import Dict, List, Any
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
@@ -60,8 +62,9 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return round(distance, 2)
 
 
+@lru_cache(maxsize=1)
 def get_mcp_url() -> str:
-    """MCP URL을 생성합니다."""
+    """MCP URL을 생성합니다. (환경 변수는 실행 중 바뀌지 않으므로 성공한 결과를 재사용, 실패는 캐시하지 않음)"""
     # 필수 환경 변수 검증
     required_vars = {
         'GOOGLE_MAPS_API_KEY': os.getenv("GOOGLE_MAPS_API_KEY"),
@@ -375,7 +378,7 @@ def process_mcp_response(result: Any, user_lat: float, user_lon: float, radius:
             return []
         
         # JSON 파싱
-        places_json = json.loads(content_list[0].text)
+        places_json = orjson.loads(content_list[0].text)
         places = places_json.get("places", [])
         
         if not places:
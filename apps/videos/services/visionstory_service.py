@@ -1,24 +1,28 @@
-import os
 import logging
 import requests
 import time
 from typing import Optional, Dict, Any
 from apps.videos.services.visionstory_video_info import VisionStoryVideoInfo
 from datetime import datetime
+from django.conf import settings
+from apps.core.http import create_session
 
 logger = logging.getLogger(__name__)
 
+# VisionStory API 호출용 keep-alive 세션 (영상 상태 폴링 시 커넥션 재사용)
+_session = create_session(pool_connections=16, pool_maxsize=32, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+
 
 class VisionStoryService:
     """VisionStory AI API와 통신하는 서비스"""
     
     def __init__(self):
         """VisionStoryService 초기화"""
-        self.api_key = os.getenv("VISIONSTORY_API_KEY")
+        self.api_key = settings.VISIONSTORY_API_KEY
         self.base_url = "https://openapi.visionstory.ai/api/v1"
         
         # 모킹 모드 설정 (크레딧 절약용)
-        self.use_mock = os.getenv("VISIONSTORY_USE_MOCK", "false").lower() == "true"
+        self.use_mock = settings.VISIONSTORY_USE_MOCK
         
         logger.info(f"VisionStory API 초기화: API 키 설정됨={bool(self.api_key)}, 모킹 모드={self.use_mock}")
         
@@ -60,7 +64,7 @@ class VisionStoryService:
             }
             
             # 공식 문서에 따른 GET 요청
-            response = requests.get(
+            response = _session.get(
                 f"{self.base_url}/video",
                 params={"video_id": video_id},
                 headers=headers,
@@ -199,7 +203,7 @@ class VisionStoryService:
                 return mock_data
             
             # 실제 VisionStory API 호출
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _session.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -327,7 +331,7 @@ class VisionStoryService:
                         logger.warning("모킹 모드: 영상 생성 완료 대기 실패, 초기 정보 사용")
             else:
                 # 실제 VisionStory API 호출
-                response = requests.post(
+                response = _session.post(
                     f"{self.base_url}/video",
                     json=payload,
                     headers=headers,
@@ -480,7 +484,7 @@ class VisionStoryService:
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(
+            response = _session.get(
                 f"{self.base_url}/avatars",
                 headers=headers,
                 timeout=10
@@ -504,7 +508,7 @@ class VisionStoryService:
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(
+            response = _session.get(
                 f"{self.base_url}/voices",
                 headers=headers,
                 timeout=10
@@ -527,7 +531,7 @@ class VisionStoryService:
                 "X-API-Key": self.api_key
             }
             
-            response = requests.get(
+            response = _session.get(
                 f"{self.base_url}/videos",
                 headers=headers,
                 timeout=10
@@ -1,7 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+from apps.authentication.permissions import IsAuthenticated
 from ..models import Video
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
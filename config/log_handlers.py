@@ -0,0 +1,44 @@
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedStreamHandler(QueueHandler):
+    """
+    로그 레코드를 큐에 넣고 백그라운드 스레드에서 스트림에 출력하는 핸들러
+
+    요청 스레드는 큐에 넣기만 하므로 stdout 쓰기/플러시를 기다리지 않습니다.
+    리스너 스레드는 fork 후 자식 프로세스로 복제되지 않으므로(gunicorn preload 등)
+    프로세스별로 첫 emit() 시점에 시작합니다.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self._stream = stream
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        """현재 프로세스에서 리스너가 실행 중이 아니면 새 큐와 리스너를 시작"""
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._listener_lock:
+            if self._listener_pid == pid:
+                return
+            # fork 이전 프로세스의 큐/리스너는 버리고 새로 생성
+            self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, logging.StreamHandler(self._stream or sys.stdout))
+            self._listener.start()
+            # 종료 시 큐에 남은 로그를 모두 출력
+            atexit.register(self._listener.stop)
+            self._listener_pid = pid
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
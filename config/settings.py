@@ -65,9 +65,12 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'apps.authentication.middleware.JWTAuthDebugMiddleware',  # 디버깅용
 ]
 
+# 디버깅용 미들웨어는 DEBUG 모드에서만 등록 (운영 환경에서는 요청당 호출 비용 없음)
+if DEBUG:
+    MIDDLEWARE.append('apps.authentication.middleware.JWTAuthDebugMiddleware')
+
 # URL 설정
 ROOT_URLCONF = 'config.urls'
 
@@ -204,7 +207,7 @@ LOGGING = {
     'handlers': {
         'console': {
             'level': 'DEBUG' if DEBUG else 'INFO',
-            'class': 'logging.StreamHandler',
+            'class': 'config.log_handlers.QueuedStreamHandler',  # stdout 출력은 백그라운드 스레드에서 처리
             'stream': sys.stdout,
         },
     },
@@ -219,8 +222,39 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'apps.authentication.authentication.CustomJWTAuthentication',
     ],
+    # JSON 응답은 orjson으로 직렬화
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.core.renderers.OrjsonRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
+# JWT 서명 키 설정 - EC P-256 개인키 경로가 있으면 ES256, 없으면 HS256(SECRET_KEY) 사용
+# (SimpleJWT의 ALLOWED_ALGORITHMS에 EdDSA가 없으므로 비대칭 서명은 ES256 사용)
+JWT_PRIVATE_KEY_PATH = os.getenv("JWT_PRIVATE_KEY_PATH")
+if JWT_PRIVATE_KEY_PATH:
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    with open(JWT_PRIVATE_KEY_PATH, "rb") as key_file:
+        JWT_SIGNING_KEY = key_file.read()
+    _jwt_private_key = serialization.load_pem_private_key(JWT_SIGNING_KEY, password=None)
+    if not (
+        isinstance(_jwt_private_key, ec.EllipticCurvePrivateKey)
+        and isinstance(_jwt_private_key.curve, ec.SECP256R1)
+    ):
+        raise ValueError("JWT_PRIVATE_KEY_PATH must point to an EC P-256 (prime256v1) private key")
+    # 공개키는 개인키에서 파생 (다른 서비스는 이 공개키만으로 검증 가능)
+    JWT_VERIFYING_KEY = _jwt_private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    JWT_ALGORITHM = 'ES256'
+else:
+    JWT_SIGNING_KEY = SECRET_KEY
+    JWT_VERIFYING_KEY = None
+    JWT_ALGORITHM = 'HS256'
+
 # JWT 설정
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=1),
@@ -229,9 +263,9 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'UPDATE_LAST_LOGIN': False,
 
-    'ALGORITHM': 'HS256',
-    'SIGNING_KEY': SECRET_KEY,
-    'VERIFYING_KEY': None,
+    'ALGORITHM': JWT_ALGORITHM,
+    'SIGNING_KEY': JWT_SIGNING_KEY,
+    'VERIFYING_KEY': JWT_VERIFYING_KEY,
     'AUDIENCE': None,
     'ISSUER': None,
 
@@ -246,15 +280,25 @@ SIMPLE_JWT = {
     'JTI_CLAIM': 'jti',
 }
 
+# JWT 검증 결과 캐시 TTL (초) - 0이면 캐시 비활성화
+JWT_CACHE_TTL = int(os.getenv("DJANGO_JWT_CACHE_TTL", "0"))
+# 인증 사용자 객체 캐시 TTL (초) - 0이면 캐시 비활성화
+JWT_USER_CACHE_TTL = int(os.getenv("DJANGO_JWT_USER_CACHE_TTL", "0"))
+
 # CORS 설정 - 환경변수로 제어
 CORS_ORIGIN_ALLOW_ALL = os.getenv("CORS_ORIGIN_ALLOW_ALL", "False").lower() == "true"
 if not CORS_ORIGIN_ALLOW_ALL:
     CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 CORS_ALLOW_CREDENTIALS = True
 
+# Google OAuth 클라이언트 ID (ID Token audience 검증용)
+GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+
 # API 키 설정
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 VISIONSTORY_API_KEY = config("VISIONSTORY_API_KEY", default="")
+# VisionStory 모킹 모드 (크레딧 절약용)
+VISIONSTORY_USE_MOCK = config("VISIONSTORY_USE_MOCK", default=False, cast=bool)
 
 # Smithery MCP 설정
 SMITHERY_API_KEY = config("SMITHERY_API_KEY", default="")
@@ -286,7 +330,39 @@ else:
     if DEBUG:
         print("WARNING: Redis running without password protection!")
 
+# 캐시 설정 (Celery 결과 백엔드와 같은 Redis, 별도 DB 사용)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": CELERY_RESULT_BACKEND.rsplit("/", 1)[0] + "/1",
+    }
+}
+
+# 같은 이미지 재업로드 시 DALL·E 결과 재사용 기간 (초)
+AVATAR_DALLE_CACHE_TTL = int(os.getenv("AVATAR_DALLE_CACHE_TTL", "86400"))
+
+# 같은 이미지 재업로드 시 아바타 생성 결과 전체를 재사용하는 기간 (초, 0이면 비활성화)
+AVATAR_RESULT_CACHE_TTL = int(os.getenv("AVATAR_RESULT_CACHE_TTL", "86400"))
+
+# async=true로 등록한 아바타 생성 작업의 상태 조회 허용 기간 (초, Celery 결과 보관 기간 기본값과 동일)
+AVATAR_TASK_TTL = int(os.getenv("AVATAR_TASK_TTL", "86400"))
+
+# VisionStory 첫 호출과 동시에 폴백용 GPT 프롬프트를 미리 생성 (지연 시간 단축 vs 추가 GPT 비용, 기본 비활성화)
+AVATAR_SPECULATIVE_PROMPT = config("AVATAR_SPECULATIVE_PROMPT", default=False, cast=bool)
+
+# 프로세스(웹 워커/Celery 워커)당 외부 API 동시 호출 수 상한 (초과 요청은 대기, 업스트림 429 방지)
+VISIONSTORY_MAX_CONCURRENCY = int(os.getenv("VISIONSTORY_MAX_CONCURRENCY", "4"))
+DALLE_MAX_CONCURRENCY = int(os.getenv("DALLE_MAX_CONCURRENCY", "2"))
+
+# 같은 OCR 텍스트에 대한 Gemini 작품 정보 추출 결과 재사용 기간 (초, 0이면 비활성화)
+ARTWORK_EXTRACTION_CACHE_TTL = int(os.getenv("ARTWORK_EXTRACTION_CACHE_TTL", str(7 * 24 * 60 * 60)))
+
+# 같은 검색어에 대한 Brave Search 결과 재사용 기간 (초, 0이면 비활성화)
+BRAVE_SEARCH_CACHE_TTL = int(os.getenv("BRAVE_SEARCH_CACHE_TTL", str(24 * 60 * 60)))
+
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Seoul'
+# 작업 이름 등을 결과와 함께 저장 (아바타 작업 상태 조회 시 작업 종류 확인)
+CELERY_RESULT_EXTENDED = True